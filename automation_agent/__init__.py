@@ -0,0 +1,3 @@
+"""
+Browser Automation Workflow System
+"""
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+CLI interface for browser automation workflow system
+"""
+
+import importlib
+import logging
+from functools import lru_cache
+import click
+from rich.console import Console
+
+# Heavier modules (rich.table, rich.progress, MCPServer, Router) are imported
+# inside the commands that use them to keep CLI startup fast
+
+console = Console()
+
+
+@lru_cache(maxsize=1)
+def get_registry():
+    """Process-wide WorkflowRegistry, so workflows are only scanned once"""
+    from .workflow_registry import WorkflowRegistry
+    return WorkflowRegistry()
+
+
+@lru_cache(maxsize=1)
+def get_router():
+    """Process-wide Router sharing the registry from get_registry()"""
+    from .router import Router
+    return Router(get_registry())
+
+
+class LazyGroup(click.Group):
+    """
+    Click group that imports each command module only when it is invoked
+    """
+    
+    # Command name -> module under automation_agent.cli_cmds exposing a same-named command
+    lazy_subcommands = {
+        "server": "server",
+        "workflows": "workflows",
+        "run": "run",
+        "create": "create",
+        "init": "init",
+    }
+    
+    def list_commands(self, ctx):
+        return sorted(list(super().list_commands(ctx)) + list(self.lazy_subcommands))
+    
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.lazy_subcommands:
+            module = importlib.import_module(
+                f".cli_cmds.{self.lazy_subcommands[cmd_name]}", __package__
+            )
+            return getattr(module, cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+
+@click.group(cls=LazyGroup)
+def cli():
+    """Browser Automation Workflow System"""
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+
+if __name__ == "__main__":
+    cli()
\ No newline at end of file
@@ -0,0 +1,3 @@
+"""
+CLI commands, one module per command, loaded on demand by the CLI group
+"""
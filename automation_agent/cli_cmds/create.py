@@ -0,0 +1,82 @@
+"""
+CLI command: create a new workflow
+"""
+
+import click
+
+from ..cli import console, get_registry
+
+
+def _prompt_steps():
+    """Collect workflow steps interactively"""
+    steps = []
+    console.print("Add workflow steps (press Enter with empty input to finish):")
+    
+    while True:
+        action = console.input("Action (navigate/click/type/extract/screenshot): ").strip()
+        if not action:
+            break
+        
+        if action == "navigate":
+            url = console.input("URL: ")
+            steps.append({"action": "navigate", "args": {"url": url}})
+        elif action == "screenshot":
+            path = console.input("Screenshot path (optional): ").strip() or "screenshot.png"
+            steps.append({"action": "screenshot", "args": {"path": path}})
+        else:
+            console.print(f"Action {action} not implemented yet", style="yellow")
+    
+    return steps
+
+
+@click.command()
+@click.argument('name')
+@click.option('--from-yaml', 'steps_file', type=click.File('r'), default=None,
+              help="Read workflow steps from a YAML file ('-' for stdin)")
+def create(name, steps_file):
+    """Create a new workflow interactively or from a YAML steps file"""
+    console.print(f"📝 Creating workflow: {name}", style="bold")
+    
+    registry = get_registry()
+    
+    if steps_file:
+        # Fast path: parse all steps in one read
+        import yaml
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        try:
+            data = yaml.load(steps_file, Loader=loader) or []
+        except yaml.YAMLError as e:
+            console.print(f"❌ Invalid steps YAML: {e}", style="red")
+            return
+        steps = data.get("steps", []) if isinstance(data, dict) else data
+        if not isinstance(steps, list) or not all(isinstance(step, dict) and "action" in step for step in steps):
+            raise click.BadParameter(
+                "steps must be a list of mappings, each with an 'action' key "
+                "(e.g. '- action: navigate' with an 'args' mapping)",
+                param_hint="'--from-yaml'"
+            )
+    else:
+        steps = _prompt_steps()
+    
+    if steps:
+        from ..workflow_registry import WorkflowSpec
+        from datetime import datetime
+        
+        spec = WorkflowSpec(
+            name=name,
+            version="1.0",
+            domain=None,
+            variables={},
+            steps=steps,
+            metadata={
+                "description": f"Custom workflow: {name}",
+                "created": datetime.now().isoformat()
+            }
+        )
+        
+        if registry.save_workflow(spec):
+            console.print(f"✅ Workflow '{name}' created successfully", style="green")
+        else:
+            console.print(f"❌ Failed to create workflow '{name}'", style="red")
+    else:
+        console.print("❌ No steps added, workflow not created", style="red")
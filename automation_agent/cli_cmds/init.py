@@ -0,0 +1,18 @@
+"""
+CLI command: initialize the system with sample workflows
+"""
+
+import click
+
+from ..cli import console, get_registry
+
+
+@click.command()
+def init():
+    """Initialize the system with sample workflows"""
+    console.print("🔧 Initializing system...", style="bold")
+    
+    registry = get_registry()
+    registry.create_sample_workflows()
+    
+    console.print("✅ System initialized with sample workflows", style="green")
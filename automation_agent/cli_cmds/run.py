@@ -0,0 +1,39 @@
+"""
+CLI command: run a workflow from a natural language prompt
+"""
+
+import asyncio
+import click
+
+from ..cli import console, get_router
+
+
+@click.command()
+@click.argument('prompt')
+def run(prompt):
+    """Run a workflow from natural language prompt"""
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    
+    async def execute_prompt():
+        console.print(f"🤖 Processing: {prompt}", style="bold")
+        
+        router = get_router()
+        
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=console
+        ) as progress:
+            task = progress.add_task("Executing workflow...", total=1)
+            
+            try:
+                result = await router.handle_prompt(prompt)
+                progress.update(task, completed=1)
+                
+                console.print("✅ Result:", style="bold green")
+                console.print(result)
+                
+            except Exception as e:
+                console.print(f"❌ Error: {e}", style="bold red")
+    
+    asyncio.run(execute_prompt())
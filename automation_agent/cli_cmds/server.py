@@ -0,0 +1,47 @@
+"""
+CLI command: start the MCP server
+"""
+
+import asyncio
+import signal
+import click
+
+from ..cli import console
+
+
+@click.command()
+@click.option('--headless/--no-headless', default=True, help='Run browser in headless mode')
+def server(headless):
+    """Start the MCP server"""
+    from ..mcp_server import MCPServer
+    from ..llm_client import close_async_client
+    
+    async def run_server():
+        console.print("🚀 Starting MCP Server...", style="bold green")
+        server = MCPServer(headless=headless)
+        
+        try:
+            result = await server.execute_command("list_workflows", {})
+            console.print(f"📋 Available workflows: {result}")
+            
+            # Keep server running until SIGINT/SIGTERM
+            console.print("✅ MCP Server is running. Press Ctrl+C to stop.")
+            stop = asyncio.Event()
+            loop = asyncio.get_running_loop()
+            try:
+                loop.add_signal_handler(signal.SIGINT, stop.set)
+                loop.add_signal_handler(signal.SIGTERM, stop.set)
+                await stop.wait()
+            except NotImplementedError:
+                # Windows loops have no signal handlers; Ctrl+C cancels the wait instead
+                try:
+                    await stop.wait()
+                except (KeyboardInterrupt, asyncio.CancelledError):
+                    pass
+            console.print("\n🛑 Shutting down server...")
+                
+        finally:
+            await server.cleanup()
+            await close_async_client()
+    
+    asyncio.run(run_server())
@@ -0,0 +1,38 @@
+"""
+CLI command: list available workflows
+"""
+
+import click
+
+from ..cli import console, get_registry
+
+
+@click.command()
+def workflows():
+    """List all available workflows"""
+    from rich.table import Table
+    
+    registry = get_registry()
+    workflows = registry.list_workflows()
+    
+    if not workflows:
+        console.print("📭 No workflows found", style="yellow")
+        return
+    
+    table = Table(title="Available Workflows")
+    table.add_column("Name", style="cyan")
+    table.add_column("Version", style="green") 
+    table.add_column("Domain", style="blue")
+    table.add_column("Steps", justify="center")
+    table.add_column("Description", style="dim")
+    
+    for workflow in workflows:
+        table.add_row(
+            workflow['name'],
+            workflow['version'],
+            workflow.get('domain', 'N/A'),
+            str(workflow['steps']),
+            workflow.get('description', '')
+        )
+    
+    console.print(table)
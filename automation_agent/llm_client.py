@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Shared OpenAI client - one pooled async connection for the whole app
+"""
+
+import os
+from functools import lru_cache
+from typing import Optional
+
+import httpx
+from openai import AsyncOpenAI
+
+
+_client: Optional[AsyncOpenAI] = None
+
+
+@lru_cache(maxsize=1)
+def _openai_api_key() -> Optional[str]:
+    """Read OPENAI_API_KEY once per process"""
+    return os.getenv("OPENAI_API_KEY")
+
+
+def get_openai_client() -> Optional[AsyncOpenAI]:
+    """
+    Get the process-wide AsyncOpenAI client, or None without an API key
+    
+    All callers share one httpx connection pool, so keep-alive connections
+    are reused instead of paying a TCP/TLS handshake per request.
+    """
+    global _client
+    if _client is None:
+        api_key = _openai_api_key()
+        if not api_key:
+            return None
+        _client = AsyncOpenAI(
+            api_key=api_key,
+            http_client=httpx.AsyncClient(
+                limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+                timeout=30
+            )
+        )
+    return _client
+
+
+async def close_async_client():
+    """Close the shared client and its connection pool"""
+    global _client
+    if _client is not None:
+        client, _client = _client, None
+        await client.close()
@@ -5,18 +5,52 @@ Provides browser automation endpoints following MCP protocol
 """
 
 import asyncio
-import json
-import os
+import logging
+import re
+import time
+from collections import deque
 from typing import Dict, Any, Optional, List
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 import traceback
 
 from browser_use import Agent
-from openai import OpenAI
-import os
+from .llm_client import get_openai_client, close_async_client
 import yaml
 
+logger = logging.getLogger(__name__)
+
+# ${var} references in workflow step arguments
+_VAR_RE = re.compile(r"\$\{([^}]+)\}")
+
+# libyaml's C loader is much faster than the pure-Python one when available
+_YAMLLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAMLDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+@lru_cache(maxsize=128)
+def _load_workflow_cached(path: str, mtime_ns: int, size: int) -> Any:
+    """
+    Parse a workflow file, cached by (path, mtime_ns, size) so edits invalidate it
+    
+    The returned object is shared between callers and must not be mutated.
+    """
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=_YAMLLoader)
+
+
+def _load_workflow(path: Path) -> Any:
+    """Load a workflow file through the parse cache"""
+    stat = path.stat()
+    return _load_workflow_cached(str(path), stat.st_mtime_ns, stat.st_size)
+
+
+def _dump_workflow(path: Path, workflow: Dict[str, Any]):
+    """Write a workflow file (blocking; run via asyncio.to_thread)"""
+    with open(path, 'w') as f:
+        yaml.dump(workflow, f, Dumper=_YAMLDumper)
+
 
 @dataclass
 class MCPCommand:
@@ -36,11 +70,15 @@ class MCPServer:
         self.headless = headless
         self.llm = None
         self.agent = None
+        self._agent_lock = asyncio.Lock()
+        self._init_lock = asyncio.Lock()
+        self._initialized = False
         self.setup_llm()
         self.commands = {}
         self.workflows_dir = Path("workflows")
         self.workflows_dir.mkdir(exist_ok=True)
-        self.logs = []
+        # Keep only the most recent command logs
+        self.logs = deque(maxlen=1000)
         
         # Register available commands
         self._register_commands()
@@ -61,14 +99,13 @@ class MCPServer:
     def setup_llm(self):
         """Setup LLM for AI-powered automation"""
         try:
-            api_key = os.getenv("OPENAI_API_KEY")
-            if api_key:
-                self.llm = OpenAI(api_key=api_key)
-                print("✅ OpenAI LLM configured successfully")
+            self.llm = get_openai_client()
+            if self.llm:
+                logger.info("✅ OpenAI LLM configured successfully")
             else:
-                print("⚠️  No OpenAI API key found, using mock responses")
+                logger.warning("⚠️  No OpenAI API key found, using mock responses")
         except Exception as e:
-            print(f"❌ LLM setup failed: {e}")
+            logger.error("❌ LLM setup failed: %s", e)
             self.llm = None
     
     async def initialize_browser(self):
@@ -80,35 +117,41 @@ class MCPServer:
                     task="Browser automation agent for workflow execution",
                     llm=self.llm
                 )
-                print("✅ Browser agent initialized successfully")
+                logger.info("✅ Browser agent initialized successfully")
                 self.browser = self.agent  # Use agent as browser
+                self._initialized = True
                 return True
             else:
-                print("⚠️  No LLM available, using mock browser")
+                logger.warning("⚠️  No LLM available, using mock browser")
                 self.browser = None
+                self._initialized = True
                 return False
         except Exception as e:
-            print(f"❌ Browser initialization failed: {e}")
+            logger.error("❌ Browser initialization failed: %s", e)
             return False
     
+    async def _ensure_browser(self):
+        """Initialize the browser once, even under concurrent callers"""
+        async with self._init_lock:
+            if not self._initialized:
+                await self.initialize_browser()
+    
+    async def _run_agent_task(self, task: str) -> Any:
+        """Run a task on the long-lived agent instead of building a new one"""
+        async with self._agent_lock:
+            self.agent.add_new_task(task)
+            return await self.agent.run()
+    
     async def navigate(self, url: str) -> Dict[str, Any]:
         """Navigate to a URL"""
         try:
-            if not self.browser:
-                await self.initialize_browser()
-            
-            if not self.browser:
-                await self.initialize_browser()
+            await self._ensure_browser()
             
             if self.agent and self.llm:
                 # Use real browser automation
                 try:
-                    # Create agent with navigation task
-                    nav_agent = Agent(
-                        task=f"Navigate to {url} and confirm the page loads",
-                        llm=self.llm
-                    )
-                    result = await nav_agent.run()
+                    # Run navigation task on the shared agent
+                    result = await self._run_agent_task(f"Navigate to {url} and confirm the page loads")
                     return {
                         "success": True, 
                         "url": url,
@@ -119,13 +162,6 @@ class MCPServer:
             else:
                 # Fallback for demo without API key
                 return {"success": True, "url": url, "message": "Navigation simulated (no API key)"}
-            
-            await page.goto(url)
-            return {
-                "success": True, 
-                "url": url,
-                "title": await page.title()
-            }
         except Exception as e:
             return {"success": False, "error": str(e)}
     
@@ -133,11 +169,7 @@ class MCPServer:
         """Click an element by selector"""
         try:
             if self.agent and self.llm:
-                click_agent = Agent(
-                    task=f"Click on the element with selector '{selector}'",
-                    llm=self.llm
-                )
-                result = await click_agent.run()
+                result = await self._run_agent_task(f"Click on the element with selector '{selector}'")
                 return {"success": True, "selector": selector, "result": str(result)}
             else:
                 return {"success": True, "selector": selector, "message": "Click simulated (no API key)"}
@@ -148,11 +180,7 @@ class MCPServer:
         """Type text into an element"""
         try:
             if self.agent and self.llm:
-                type_agent = Agent(
-                    task=f"Type '{text}' into the element with selector '{selector}'",
-                    llm=self.llm
-                )
-                result = await type_agent.run()
+                result = await self._run_agent_task(f"Type '{text}' into the element with selector '{selector}'")
                 return {"success": True, "selector": selector, "text": text, "result": str(result)}
             else:
                 return {"success": True, "selector": selector, "text": text, "message": "Type simulated (no API key)"}
@@ -163,11 +191,7 @@ class MCPServer:
         """Extract text content from an element"""
         try:
             if self.agent and self.llm:
-                extract_agent = Agent(
-                    task=f"Extract text content from the element with selector '{selector}'",
-                    llm=self.llm
-                )
-                result = await extract_agent.run()
+                result = await self._run_agent_task(f"Extract text content from the element with selector '{selector}'")
                 return {"success": True, "selector": selector, "content": str(result)}
             else:
                 return {"success": True, "selector": selector, "content": "Mock extracted content (no API key)"}
@@ -178,11 +202,7 @@ class MCPServer:
         """Take a screenshot"""
         try:
             if self.agent and self.llm:
-                screenshot_agent = Agent(
-                    task=f"Take a screenshot and save it to {path}",
-                    llm=self.llm
-                )
-                result = await screenshot_agent.run()
+                result = await self._run_agent_task(f"Take a screenshot and save it to {path}")
                 return {"success": True, "path": path, "result": str(result)}
             else:
                 return {"success": True, "path": path, "message": "Screenshot simulated (no API key)"}
@@ -196,8 +216,7 @@ class MCPServer:
             if not workflow_path.exists():
                 return {"success": False, "error": f"Workflow '{name}' not found"}
             
-            with open(workflow_path, 'r') as f:
-                workflow = yaml.safe_load(f)
+            workflow = await asyncio.to_thread(_load_workflow, workflow_path)
             
             # Simple workflow execution
             results = []
@@ -233,8 +252,7 @@ class MCPServer:
             }
             
             workflow_path = self.workflows_dir / f"{name}.yaml"
-            with open(workflow_path, 'w') as f:
-                yaml.dump(workflow, f)
+            await asyncio.to_thread(_dump_workflow, workflow_path, workflow)
             
             return {"success": True, "workflow": name, "recording": True}
         except Exception as e:
@@ -243,33 +261,43 @@ class MCPServer:
     async def list_workflows(self) -> Dict[str, Any]:
         """List all available workflows"""
         try:
-            workflows = []
-            for workflow_file in self.workflows_dir.glob("*.yaml"):
-                with open(workflow_file, 'r') as f:
-                    workflow = yaml.safe_load(f)
-                    workflows.append({
-                        "name": workflow.get('name'),
-                        "version": workflow.get('version'),
-                        "file": workflow_file.name
-                    })
+            # Read and parse files concurrently on the default thread pool
+            workflow_files = list(self.workflows_dir.glob("*.yaml"))
+            parsed = await asyncio.gather(
+                *(asyncio.to_thread(_load_workflow, workflow_file) for workflow_file in workflow_files)
+            )
+            workflows = [
+                {
+                    "name": workflow.get('name'),
+                    "version": workflow.get('version'),
+                    "file": workflow_file.name
+                }
+                for workflow_file, workflow in zip(workflow_files, parsed)
+            ]
             
             return {"success": True, "workflows": workflows}
         except Exception as e:
             return {"success": False, "error": str(e)}
     
     def _substitute_variables(self, args: Dict[str, Any], variables: Dict[str, Any]) -> Dict[str, Any]:
-        """Substitute variables in arguments"""
-        result = {}
-        for key, value in args.items():
-            if isinstance(value, str) and value.startswith("${") and value.endswith("}"):
-                var_name = value[2:-1]
-                result[key] = variables.get(var_name, value)
-            else:
-                result[key] = value
-        return result
+        """Substitute ${var} references (whole values or embedded) in arguments"""
+        def replace(match: "re.Match") -> str:
+            return str(variables.get(match.group(1), match.group(0)))
+        
+        def substitute(value: Any) -> Any:
+            if not isinstance(value, str) or "${" not in value:
+                return value
+            whole = _VAR_RE.fullmatch(value)
+            if whole:
+                # A value that is exactly one reference keeps the variable's type
+                return variables.get(whole.group(1), value)
+            return _VAR_RE.sub(replace, value)
+        
+        return {key: substitute(value) for key, value in args.items()}
     
     async def execute_command(self, command_name: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
         """Execute an MCP command"""
+        timestamp = time.monotonic_ns()
         try:
             if command_name not in self.commands:
                 return {"success": False, "error": f"Unknown command: {command_name}"}
@@ -282,30 +310,33 @@ class MCPServer:
                 "command": command_name,
                 "parameters": parameters,
                 "result": result,
-                "timestamp": asyncio.get_event_loop().time()
+                "timestamp": timestamp
             })
             
             return result
         except Exception as e:
-            error_result = {"success": False, "error": str(e), "traceback": traceback.format_exc()}
+            error_result = {"success": False, "error": str(e)}
+            # Formatting the traceback walks every frame; only pay for it when debugging
+            if logger.isEnabledFor(logging.DEBUG):
+                error_result["traceback"] = traceback.format_exc()
             self.logs.append({
                 "command": command_name,
                 "parameters": parameters,
                 "result": error_result,
-                "timestamp": asyncio.get_event_loop().time()
+                "timestamp": timestamp
             })
             return error_result
     
     async def cleanup(self):
-        """Clean up resources"""
+        """Clean up this server's browser (the shared LLM client is closed at process exit)"""
         try:
             if self.agent and hasattr(self.agent, 'close'):
                 await self.agent.close()
             elif self.browser and hasattr(self.browser, 'close'):
                 await self.browser.close()
-            print("✅ Resources cleaned up successfully")
+            logger.info("✅ Resources cleaned up successfully")
         except Exception as e:
-            print(f"⚠️  Cleanup warning: {e}")
+            logger.warning("⚠️  Cleanup warning: %s", e)
 
 
 # Example usage and test
@@ -337,7 +368,9 @@ async def main():
         print(traceback.format_exc())
     finally:
         await server.cleanup()
+        await close_async_client()
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     asyncio.run(main())
\ No newline at end of file
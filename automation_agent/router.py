@@ -0,0 +1,506 @@
+#!/usr/bin/env python3
+"""
+Router - Planner-Executor that routes prompts to workflows or agents
+"""
+
+import asyncio
+import copy
+import hashlib
+import logging
+import time
+from typing import Dict, Any, Optional, Tuple, List, Callable, Awaitable
+from urllib.parse import urlsplit
+import re
+
+import orjson
+
+from .llm_client import get_openai_client
+from .mcp_server import MCPServer
+from .workflow_registry import WorkflowRegistry
+
+logger = logging.getLogger(__name__)
+
+
+# Static system prompt for AI parsing. Keep this byte-identical between calls and
+# above 1024 tokens so the provider's automatic prefix cache can serve the prefill;
+# only the user message should vary per request.
+SYSTEM_PROMPT = """You are a workflow parsing assistant for a browser automation system. \
+Users describe tasks they want performed in SaaS web applications, and your job is to \
+turn each description into a structured routing decision.
+
+Parse user prompts to extract:
+1. site: domain/platform (jira, github, salesforce, etc.)
+2. intent: action type (navigate, export, create, search, test, etc.)
+3. variables: extracted parameters (project_key, url, dates, etc.)
+
+Rules:
+- site is the platform the task runs against. Use a short lowercase name such as \
+"jira", "github", "salesforce", "confluence", "slack", "zendesk" or a bare domain such \
+as "example.com" when the user gives a URL. Use null when no site is mentioned or implied.
+- intent is a single lowercase verb describing the primary action. Prefer one of: \
+navigate, export, create, search, update, test, extract, screenshot, login, general. \
+Use "general" only when none of the others fit.
+- variables holds every concrete parameter needed to run the task. Use snake_case keys. \
+Common keys are project_key, url, start_date, end_date, title, description, query, \
+repository, record_type, assignee, status, output_format and path.
+- Dates must be ISO 8601 (YYYY-MM-DD). Resolve month names and ranges when the year is \
+given; otherwise keep the text the user wrote.
+- Project keys are uppercase (e.g. ENG, PROJ). Keep URLs exactly as written.
+- Never invent values that are not present in the prompt. Omit unknown variables \
+instead of guessing.
+- Do not include explanations, markdown or extra keys.
+
+Respond ONLY with JSON in this exact format:
+{"site": "domain or null", "intent": "action", "variables": {"key": "value"}}
+
+Examples:
+
+Prompt: Export all Jira tickets for project ENG from 2025-09-01 to 2025-09-15
+{"site": "jira", "intent": "export", "variables": {"project_key": "ENG", "start_date": "2025-09-01", "end_date": "2025-09-15"}}
+
+Prompt: Download the PROJ backlog from jira as csv
+{"site": "jira", "intent": "export", "variables": {"project_key": "PROJ", "output_format": "csv"}}
+
+Prompt: Create a jira bug in OPS titled "Login page returns 500"
+{"site": "jira", "intent": "create", "variables": {"project_key": "OPS", "ticket_type": "Bug", "title": "Login page returns 500"}}
+
+Prompt: Find open jira issues assigned to maria in project WEB
+{"site": "jira", "intent": "search", "variables": {"project_key": "WEB", "assignee": "maria", "status": "open"}}
+
+Prompt: Search github for issues mentioning memory leak in acme/api
+{"site": "github", "intent": "search", "variables": {"repository": "acme/api", "query": "memory leak"}}
+
+Prompt: Open the pull requests page of github repo acme/web
+{"site": "github", "intent": "navigate", "variables": {"repository": "acme/web", "url": "https://github.com/acme/web/pulls"}}
+
+Prompt: Create a new Salesforce lead for Jane Doe at Initech
+{"site": "salesforce", "intent": "create", "variables": {"record_type": "lead", "name": "Jane Doe", "company": "Initech"}}
+
+Prompt: Export the Salesforce opportunities closed in March 2025
+{"site": "salesforce", "intent": "export", "variables": {"record_type": "opportunity", "status": "closed", "start_date": "2025-03-01", "end_date": "2025-03-31"}}
+
+Prompt: Navigate to https://example.com and take a screenshot
+{"site": "example.com", "intent": "navigate", "variables": {"url": "https://example.com", "path": "screenshot.png"}}
+
+Prompt: Test the navigation workflow
+{"site": null, "intent": "test", "variables": {}}
+
+Prompt: Grab the heading text from https://status.example.com
+{"site": "example.com", "intent": "extract", "variables": {"url": "https://status.example.com", "selector": "h1"}}
+
+Prompt: Log in to zendesk and search tickets about refunds
+{"site": "zendesk", "intent": "search", "variables": {"query": "refunds"}}
+
+Prompt: Update the status of jira ticket ENG-42 to Done
+{"site": "jira", "intent": "update", "variables": {"ticket_id": "ENG-42", "status": "Done"}}
+
+Prompt: Go to confluence and export the Onboarding page as pdf
+{"site": "confluence", "intent": "export", "variables": {"page": "Onboarding", "output_format": "pdf"}}
+
+Prompt: Check that https://app.example.com/login loads
+{"site": "example.com", "intent": "test", "variables": {"url": "https://app.example.com/login"}}
+
+Prompt: Post "deploy finished" in the #releases slack channel
+{"site": "slack", "intent": "create", "variables": {"channel": "#releases", "message": "deploy finished"}}
+
+Prompt: What can you do?
+{"site": null, "intent": "general", "variables": {}}
+"""
+
+# Regex fallback parser tables. Each keyword set is scanned with one compiled
+# alternation instead of a chain of substring checks.
+_SITE_KEYWORDS = {
+    "jira": "jira.company.com",
+    "github": "github.com",
+    "example.com": "example.com",
+}
+_INTENT_PRIORITY = [
+    ("export", ["export", "download", "get", "extract"]),
+    ("navigate", ["navigate", "go", "visit", "open"]),
+    ("test", ["test", "check", "verify"]),
+]
+_INTENT_KEYWORDS = {
+    word: (priority, intent)
+    for priority, (intent, words) in enumerate(_INTENT_PRIORITY)
+    for word in words
+}
+_SITE_RE = re.compile(r"\b(" + "|".join(map(re.escape, _SITE_KEYWORDS)) + r")\b", re.IGNORECASE)
+_INTENT_RE = re.compile(r"\b(" + "|".join(map(re.escape, _INTENT_KEYWORDS)) + r")\b", re.IGNORECASE)
+_VARIABLES_RE = re.compile(
+    r'project[:\s]+(?P<project_key>[A-Z]+)|(?P<url>https?://[^\s]+)', re.IGNORECASE
+)
+_URL_RE = re.compile(r'https?://[^\s]+')
+
+
+def _detect_site(text: str) -> Optional[str]:
+    """Canonical site for the first known keyword in text (earlier entries in _SITE_KEYWORDS win)"""
+    site_matches = {m.lower() for m in _SITE_RE.findall(text)}
+    return next((canonical for keyword, canonical in _SITE_KEYWORDS.items()
+                 if keyword in site_matches), None)
+
+
+def _url_site(url: str) -> Optional[str]:
+    """Site for a URL: a known keyword if present, otherwise its host"""
+    return _detect_site(url) or urlsplit(url).hostname
+
+
+# Trivial prompts that can be parsed without an LLM round-trip
+_TRIVIAL_NAVIGATE_RE = re.compile(
+    r'^\s*(?:navigate|go|visit|open)\s+(?:to\s+)?(?P<url>https?://\S+)\s*$', re.IGNORECASE
+)
+_TRIVIAL_SCREENSHOT_RE = re.compile(
+    r'^\s*(?:take\s+(?:a\s+)?)?screenshot(?:\s+(?:of|at)\s+(?P<url>https?://\S+))?\s*$', re.IGNORECASE
+)
+
+BATCH_INSTRUCTIONS = """The user message is a JSON array of {count} prompts. Parse each one \
+independently using the rules above and respond ONLY with JSON in this format:
+{{"results": [<parse object for prompt 1>, <parse object for prompt 2>, ...]}}
+The results array must contain exactly {count} objects, in the same order as the prompts."""
+
+
+class PromptBatcher:
+    """
+    Coalesces concurrent prompt parses into a single LLM request
+    
+    A prompt submitted while no batch is in flight is dispatched immediately.
+    Under load, prompts are collected for up to `window` seconds (or until
+    `max_batch` are queued) and parsed together.
+    """
+    
+    def __init__(self, parse_batch: Callable[[List[str]], Awaitable[List[Dict[str, Any]]]],
+                 max_batch: int = 8, window: float = 0.25):
+        self.parse_batch = parse_batch
+        self.max_batch = max_batch
+        self.window = window
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._loop = None
+        self._in_flight = 0
+        self._dispatches = set()
+    
+    async def submit(self, prompt: str) -> Dict[str, Any]:
+        """Queue a prompt and wait for its parse result"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Queues and tasks are bound to a loop; start fresh for a new one
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = None
+            self._in_flight = 0
+        if self._worker is None or self._worker.done():
+            self._worker = loop.create_task(self._run())
+        
+        future = loop.create_future()
+        self._queue.put_nowait((prompt, future))
+        return await future
+    
+    async def _run(self):
+        """Collect queued prompts into batches and dispatch them"""
+        while True:
+            batch = [await self._queue.get()]
+            
+            if self._in_flight:
+                # Other requests are pending, so wait briefly for more prompts
+                deadline = self._loop.time() + self.window
+                while len(batch) < self.max_batch:
+                    timeout = deadline - self._loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+            else:
+                while len(batch) < self.max_batch and not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+            
+            self._in_flight += 1
+            task = self._loop.create_task(self._dispatch(batch))
+            # Hold a reference until the dispatch finishes
+            self._dispatches.add(task)
+            task.add_done_callback(self._dispatches.discard)
+    
+    async def _dispatch(self, batch: List[Tuple[str, asyncio.Future]]):
+        """Parse a batch and resolve each caller's future"""
+        try:
+            results = await self.parse_batch([prompt for prompt, _ in batch])
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            self._in_flight -= 1
+
+
+class Router:
+    """
+    Routes user prompts to appropriate workflows or falls back to browser agents
+    """
+    
+    # Parsed prompt cache limits
+    parse_cache_size = 1024
+    parse_cache_ttl = 300.0
+    
+    def __init__(self, registry: Optional[WorkflowRegistry] = None):
+        self.registry = registry or WorkflowRegistry()
+        self.server = MCPServer()
+        self.llm = None
+        self.setup_llm()
+        self.batcher = PromptBatcher(self._ai_parse_batch)
+        self._parse_cache: Dict[bytes, Tuple[float, Tuple[Optional[str], str, Dict[str, Any]]]] = {}
+        
+    def setup_llm(self):
+        """Setup LLM for AI-powered prompt parsing"""
+        try:
+            self.llm = get_openai_client()
+            if self.llm:
+                logger.info("✅ Router LLM configured for AI parsing")
+            else:
+                logger.warning("⚠️  No OpenAI API key, using regex parsing fallback")
+        except Exception as e:
+            logger.error("❌ Router LLM setup failed: %s", e)
+            self.llm = None
+        
+    async def handle_prompt(self, prompt: str) -> Dict[str, Any]:
+        """
+        Main routing logic: prompt -> workflow or agent
+        """
+        try:
+            # Parse the prompt to identify site, intent, and variables
+            site, intent, variables = await self.parse_prompt(prompt)
+            
+            # Try to find matching workflow
+            workflow = self.registry.find_workflow(site, intent)
+            
+            if workflow:
+                logger.info("📋 Found workflow: %s", workflow.name)
+                try:
+                    # Run the workflow
+                    result = await self.server.run_workflow(workflow.name, variables)
+                    return {
+                        "success": True,
+                        "source": "workflow",
+                        "workflow": workflow.name,
+                        "result": result
+                    }
+                except Exception as e:
+                    logger.warning("⚠️  Workflow failed, falling back to agent: %s", e)
+                    return await self.fallback_to_agent(prompt, workflow)
+            else:
+                logger.info("🤖 No matching workflow, using agent")
+                return await self.fallback_to_agent(prompt)
+                
+        except Exception as e:
+            return {
+                "success": False,
+                "error": str(e),
+                "source": "router"
+            }
+    
+    async def parse_prompt(self, prompt: str) -> Tuple[Optional[str], str, Dict[str, Any]]:
+        """
+        AI-powered parsing to extract site, intent, and variables from natural language
+        
+        Successful AI parses are memoized per whitespace-trimmed prompt for
+        parse_cache_ttl seconds; regex fallbacks are not cached.
+        """
+        trivial = self.trivial_parse_prompt(prompt)
+        if trivial:
+            return trivial
+        if not self.llm:
+            return self.regex_parse_prompt(prompt)
+        
+        # Case is kept: variables such as URLs, titles and project keys are case-sensitive
+        key = hashlib.blake2b(prompt.strip().encode(), digest_size=16).digest()
+        cached = self._parse_cache.get(key)
+        if cached and time.monotonic() - cached[0] < self.parse_cache_ttl:
+            site, intent, variables = cached[1]
+            return site, intent, copy.deepcopy(variables)
+        
+        try:
+            parsed = await self._ai_parse_prompt(prompt)
+        except Exception as e:
+            # Don't pin a degraded parse for the whole TTL
+            logger.warning("⚠️  AI parsing failed, falling back to regex: %s", e)
+            return self.regex_parse_prompt(prompt)
+        
+        self._parse_cache.pop(key, None)
+        if len(self._parse_cache) >= self.parse_cache_size:
+            # Evict the oldest entry (dicts keep insertion order)
+            del self._parse_cache[next(iter(self._parse_cache))]
+        site, intent, variables = parsed
+        self._parse_cache[key] = (time.monotonic(), (site, intent, copy.deepcopy(variables)))
+        return parsed
+    
+    def trivial_parse_prompt(self, prompt: str) -> Optional[Tuple[Optional[str], str, Dict[str, Any]]]:
+        """
+        Parse simple "navigate to <url>" / "screenshot" prompts without the LLM
+        """
+        match = _TRIVIAL_NAVIGATE_RE.match(prompt)
+        if match:
+            url = match.group("url")
+            return _url_site(url), "navigate", {"url": url}
+        
+        match = _TRIVIAL_SCREENSHOT_RE.match(prompt)
+        if match:
+            url = match.group("url")
+            if url:
+                return _url_site(url), "screenshot", {"url": url}
+            return None, "screenshot", {}
+        
+        return None
+    
+    async def ai_parse_prompt(self, prompt: str) -> Tuple[Optional[str], str, Dict[str, Any]]:
+        """
+        Use AI to parse natural language prompts intelligently
+        """
+        try:
+            return await self._ai_parse_prompt(prompt)
+        except Exception as e:
+            logger.warning("⚠️  AI parsing failed, falling back to regex: %s", e)
+            return self.regex_parse_prompt(prompt)
+    
+    async def _ai_parse_prompt(self, prompt: str) -> Tuple[Optional[str], str, Dict[str, Any]]:
+        """
+        AI parse without the regex fallback; raises if the LLM call fails
+        """
+        result = await self.batcher.submit(prompt)
+        
+        site = result.get("site")
+        if site == "null" or site == "None":
+            site = None
+        intent = result.get("intent", "general")
+        variables = result.get("variables", {})
+        
+        logger.info("🤖 AI parsed - Site: %s, Intent: %s, Variables: %s", site, intent, variables)
+        return site, intent, variables
+    
+    async def _ai_parse_batch(self, prompts: List[str]) -> List[Dict[str, Any]]:
+        """
+        Parse one or more prompts with a single LLM request
+        """
+        messages = [{"role": "system", "content": SYSTEM_PROMPT}]
+        if len(prompts) == 1:
+            messages.append({"role": "user", "content": f"Parse this prompt: {prompts[0]}"})
+        else:
+            # Batch instructions go after the static prefix so it stays cacheable
+            messages.append({"role": "system", "content": BATCH_INSTRUCTIONS.format(count=len(prompts))})
+            messages.append({"role": "user", "content": orjson.dumps(prompts).decode()})
+        
+        # Stream the completion so decoding overlaps with generation
+        stream = await self.llm.chat.completions.create(
+            model="gpt-5",
+            messages=messages,
+            response_format={"type": "json_object"},
+            stream=True
+        )
+        content = []
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                content.append(chunk.choices[0].delta.content)
+        
+        result = orjson.loads("".join(content))
+        if len(prompts) == 1:
+            return [result]
+        
+        results = result.get("results", [])
+        if len(results) != len(prompts):
+            raise ValueError(f"Expected {len(prompts)} parse results, got {len(results)}")
+        return results
+    
+    def regex_parse_prompt(self, prompt: str) -> Tuple[Optional[str], str, Dict[str, Any]]:
+        """
+        Fallback regex-based parsing
+        """
+        # Detect common sites/domains
+        site = _detect_site(prompt)
+        
+        # Extract intent keywords (lowest priority number wins)
+        intent = min(
+            (_INTENT_KEYWORDS[m.lower()] for m in _INTENT_RE.findall(prompt)),
+            default=(len(_INTENT_PRIORITY), "general"),
+        )[1]
+        
+        # Extract basic variables (simplified)
+        variables = {}
+        
+        # Look for project keys and URLs in a single pass (first match of each wins)
+        for match in _VARIABLES_RE.finditer(prompt):
+            if match.group('project_key'):
+                variables.setdefault('project_key', match.group('project_key'))
+            elif match.group('url'):
+                variables.setdefault('url', match.group('url'))
+        
+        logger.info("🔍 Regex parsed - Site: %s, Intent: %s, Variables: %s", site, intent, variables)
+        return site, intent, variables
+    
+    async def fallback_to_agent(self, prompt: str, failed_workflow=None) -> Dict[str, Any]:
+        """
+        Fallback to browser-use agent when workflow fails or doesn't exist
+        """
+        try:
+            # For now, simulate agent execution
+            logger.info("🤖 Agent processing: %s", prompt)
+            
+            # Execute basic commands based on prompt
+            result = {"success": True, "message": "Agent execution simulated"}
+            
+            if "navigate" in prompt.lower():
+                # Extract URL or use default
+                url = "https://example.com"
+                url_match = _URL_RE.search(prompt)
+                if url_match:
+                    url = url_match.group(0)
+                
+                nav_result = await self.server.navigate(url)
+                result["navigation"] = nav_result
+            
+            if "screenshot" in prompt.lower():
+                screenshot_result = await self.server.screenshot()
+                result["screenshot"] = screenshot_result
+            
+            return {
+                "success": True,
+                "source": "agent",
+                "prompt": prompt,
+                "result": result
+            }
+            
+        except Exception as e:
+            return {
+                "success": False,
+                "error": str(e),
+                "source": "agent"
+            }
+
+
+# Test function
+async def test_router():
+    """Test the router functionality"""
+    router = Router()
+    
+    # Initialize sample workflows
+    router.registry.create_sample_workflows()
+    
+    # The no-LLM fast path must still resolve the site so site workflows match
+    site, intent, variables = await router.parse_prompt("navigate to https://example.com")
+    assert (site, intent, variables) == ("example.com", "navigate", {"url": "https://example.com"}), (site, intent, variables)
+    
+    test_prompts = [
+        "Navigate to example.com and take a screenshot",
+        "Go to jira and export tickets", 
+        "Test the navigation workflow"
+    ]
+    
+    for prompt in test_prompts:
+        print(f"\n🧪 Testing: {prompt}")
+        result = await router.handle_prompt(prompt)
+        print(f"Result: {result}")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    asyncio.run(test_router())
\ No newline at end of file
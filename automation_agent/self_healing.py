@@ -0,0 +1,570 @@
+#!/usr/bin/env python3
+"""
+Self-Healing Mechanism - AI-powered workflow repair and adaptation
+"""
+
+import asyncio
+import copy
+import itertools
+import logging
+import re
+import sys
+import time
+from collections import defaultdict, deque
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional, Tuple
+from dataclasses import dataclass, replace
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+
+import orjson
+from browser_use import Agent
+from .workflow_registry import WorkflowRegistry, WorkflowSpec
+
+logger = logging.getLogger(__name__)
+
+_now = datetime.now
+
+# Read-only stand-in for steps without args
+_EMPTY_ARGS: Mapping[str, Any] = MappingProxyType({})
+
+# Response template while healing is disabled (read-only; callers get a copy)
+_DISABLED_RESPONSE = MappingProxyType({"success": False, "error": "Self-healing is disabled"})
+
+# Alternative selector templates per failing selector shape
+# ID selector failed, try class or attribute selectors
+_ID_ALTS = (".{0}", "[id*='{0}']", "[name='{0}']")
+# Class selector failed, try ID or tag selectors
+_CLASS_ALTS = ("#{0}", "[class*='{0}']", "button[class*='{0}']")
+# Complex selector, suggest more robust alternatives ({0} = last token, {1} = full selector)
+_COMPLEX_ALTS = ("[data-testid*='{0}']", "[aria-label*='{1}']", "button:contains('{1}')")
+
+# Heuristic selector replacements used in place of DOM analysis, checked in order
+_SELECTOR_HEURISTICS = (
+    (re.compile(r"#.*submit|submit.*#"), "button[type='submit'], input[type='submit']"),
+    (re.compile(r"login"), "#login, .login-button, button[data-action='login']"),
+)
+
+
+@lru_cache(maxsize=1024)
+def _alternative_selectors(current_selector: str) -> Tuple[str, ...]:
+    """Alternative selectors for a failing one; depends only on the selector string"""
+    prefix = current_selector[:1]
+    if prefix == '#':
+        return tuple(t.format(current_selector[1:]) for t in _ID_ALTS)
+    if prefix == '.':
+        return tuple(t.format(current_selector[1:]) for t in _CLASS_ALTS)
+    last_token = current_selector.rpartition(' ')[2] or current_selector
+    return tuple(t.format(last_token, current_selector) for t in _COMPLEX_ALTS)
+
+
+@dataclass(slots=True)
+class RepairSuggestion:
+    """Represents a workflow repair suggestion"""
+    workflow_name: str
+    step_index: int
+    issue_type: str
+    issue_description: str
+    suggested_fix: Dict[str, Any]
+    confidence_score: float
+    timestamp: str
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict view without asdict's deep copy of suggested_fix"""
+        return {
+            "workflow_name": self.workflow_name,
+            "step_index": self.step_index,
+            "issue_type": self.issue_type,
+            "issue_description": self.issue_description,
+            "suggested_fix": self.suggested_fix,
+            "confidence_score": self.confidence_score,
+            "timestamp": self.timestamp,
+        }
+
+
+@dataclass(slots=True)
+class WorkflowFailure:
+    """Represents a workflow execution failure"""
+    workflow_name: str
+    step_index: int
+    error_type: str
+    error_message: str
+    screenshot_path: Optional[str]
+    dom_snapshot: Optional[str]
+    timestamp: str
+
+
+class SelfHealingEngine:
+    """
+    Engine for detecting workflow failures and generating repair suggestions
+    """
+    
+    # Error patterns and their repair handlers, checked in order
+    _DISPATCH = (
+        # Selector drift - most common web automation failure
+        (re.compile(r"selector|element not found", re.IGNORECASE), "suggest_selector_repair"),
+        (re.compile(r"timeout", re.IGNORECASE), "suggest_timeout_repair"),
+        (re.compile(r"network|connection", re.IGNORECASE), "suggest_network_repair"),
+        (re.compile(r"authentication|login", re.IGNORECASE), "suggest_auth_repair"),
+    )
+    
+    # Oldest failures and suggestions are evicted past this many entries
+    history_size = 10_000
+    # Recurring identical failures reuse the suggestion generated for the first one
+    suggestion_cache_size = 256
+    # Suggestion files are written in batches by one background task
+    save_batch_size = 32
+    save_batch_window = 0.05
+    
+    def __init__(self, workflow_registry: WorkflowRegistry, repair_agent: Optional[Agent] = None):
+        self.registry = workflow_registry
+        self.repair_agent = repair_agent
+        self.failures_log = deque(maxlen=self.history_size)
+        self.repair_suggestions = deque(maxlen=self.history_size)
+        # Per-workflow views so filtered queries skip the full history scan; entries
+        # leave them together with the global history (see _append_indexed)
+        self._failures_by_wf: Dict[str, deque] = defaultdict(deque)
+        self._suggestions_by_wf: Dict[str, deque] = defaultdict(deque)
+        self._suggestion_cache: Dict[Tuple[str, str, str, int], RepairSuggestion] = {}
+        self.healing_enabled = True
+        self._save_queue: Optional[asyncio.Queue] = None
+        self._saver_task: Optional[asyncio.Task] = None
+        self._save_counter = itertools.count()
+        
+        # Create repair suggestions directory
+        self.repairs_dir = Path("repairs")
+        self.repairs_dir.mkdir(exist_ok=True)
+        
+    def enable_healing(self, enabled: bool = True):
+        """Enable or disable self-healing"""
+        self.healing_enabled = enabled
+        logger.info("🔧 Self-healing %s", "enabled" if enabled else "disabled")
+    
+    async def handle_workflow_failure(self, workflow_name: str, step_index: int, 
+                                    error: Exception, context: Dict[str, Any] = None) -> Dict[str, Any]:
+        """
+        Handle a workflow failure and attempt repair
+        """
+        if not self.healing_enabled:
+            return dict(_DISABLED_RESPONSE)
+        
+        try:
+            # Names come from a small closed set and key the history indexes and suggestion cache
+            workflow_name = sys.intern(workflow_name)
+            
+            # Record the failure
+            failure = WorkflowFailure(
+                workflow_name=workflow_name,
+                step_index=step_index,
+                error_type=sys.intern(type(error).__name__),
+                error_message=str(error),
+                screenshot_path=context.get('screenshot_path') if context else None,
+                dom_snapshot=context.get('dom_snapshot') if context else None,
+                timestamp=_now().isoformat()
+            )
+            
+            self._append_indexed(self.failures_log, self._failures_by_wf, failure)
+            logger.info("🚨 Workflow failure recorded: %s at step %s", workflow_name, step_index)
+            
+            # Analyze the failure and generate repair suggestion
+            suggestion = await self.analyze_and_repair(failure)
+            
+            if suggestion:
+                self._append_indexed(self.repair_suggestions, self._suggestions_by_wf, suggestion)
+                
+                # Save repair suggestion for human review
+                await self.save_repair_suggestion(suggestion)
+                
+                return {
+                    "success": True,
+                    "failure_recorded": True,
+                    "repair_suggested": True,
+                    "suggestion": suggestion.to_dict(),
+                    "requires_approval": True
+                }
+            else:
+                return {
+                    "success": False,
+                    "failure_recorded": True,
+                    "repair_suggested": False,
+                    "message": "Could not generate repair suggestion"
+                }
+                
+        except Exception as e:
+            logger.error("❌ Self-healing error: %s", e)
+            return {
+                "success": False,
+                "error": f"Self-healing failed: {str(e)}"
+            }
+    
+    async def analyze_and_repair(self, failure: WorkflowFailure) -> Optional[RepairSuggestion]:
+        """
+        Analyze failure and generate repair suggestion using AI
+        """
+        cache_key = (failure.error_type, failure.error_message, failure.workflow_name, failure.step_index)
+        cached = self._suggestion_cache.pop(cache_key, None)
+        if cached is not None:
+            # Re-insert to mark as most recently used
+            self._suggestion_cache[cache_key] = cached
+            # Each caller gets its own fix, so mutating it can't corrupt the cache
+            return replace(cached, timestamp=failure.timestamp,
+                           suggested_fix=copy.deepcopy(cached.suggested_fix))
+        
+        try:
+            # Get the failing workflow
+            workflow = self.registry.get_workflow(failure.workflow_name)
+            if not workflow:
+                return None
+            
+            # Get the failing step
+            if failure.step_index >= len(workflow.steps):
+                return None
+                
+            failing_step = workflow.steps[failure.step_index]
+            
+            # Classify the error and suggest repair
+            suggestion = await self.classify_and_suggest_repair(failure, failing_step, workflow)
+            
+            if suggestion is not None:
+                if len(self._suggestion_cache) >= self.suggestion_cache_size:
+                    del self._suggestion_cache[next(iter(self._suggestion_cache))]
+                self._suggestion_cache[cache_key] = replace(
+                    suggestion, suggested_fix=copy.deepcopy(suggestion.suggested_fix)
+                )
+            
+            return suggestion
+            
+        except Exception as e:
+            logger.error("❌ Analysis failed: %s", e)
+            return None
+    
+    async def classify_and_suggest_repair(self, failure: WorkflowFailure, 
+                                        failing_step: Dict[str, Any], 
+                                        workflow: WorkflowSpec) -> Optional[RepairSuggestion]:
+        """
+        Classify error type and generate specific repair suggestions
+        """
+        for pattern, handler_name in self._DISPATCH:
+            if pattern.search(failure.error_message):
+                return await getattr(self, handler_name)(failure, failing_step)
+        
+        # Generic repair using AI agent
+        return await self.suggest_generic_repair(failure, failing_step)
+    
+    @staticmethod
+    def _make_suggestion(failure: WorkflowFailure, issue_type: str, description: str,
+                         fix: Dict[str, Any], confidence: float) -> RepairSuggestion:
+        """
+        Build a suggestion for the failing step, stamped with the failure time
+        """
+        return RepairSuggestion(failure.workflow_name, failure.step_index, issue_type,
+                                description, fix, confidence, failure.timestamp)
+    
+    async def suggest_selector_repair(self, failure: WorkflowFailure, 
+                                    failing_step: Dict[str, Any]) -> RepairSuggestion:
+        """
+        Suggest repairs for selector-based failures (most common)
+        """
+        args = failing_step.get('args') or _EMPTY_ARGS
+        current_selector = args.get('selector', '')
+        
+        # Generate alternative selectors based on common patterns
+        alternative_selectors = list(_alternative_selectors(current_selector))
+        
+        # Use AI agent for more intelligent selector repair if available
+        if self.repair_agent:
+            ai_suggestion = await self.get_ai_selector_suggestion(failure, failing_step)
+            if ai_suggestion:
+                alternative_selectors.insert(0, ai_suggestion)
+        
+        # Create repair suggestion with the best alternative
+        # Only the args subtree is rebuilt, so the original step is never mutated
+        suggested_fix = {
+            **failing_step,
+            "args": {
+                **args,
+                "selector": alternative_selectors[0] if alternative_selectors else current_selector
+            }
+        }
+        
+        return self._make_suggestion(
+            failure, "selector_drift",
+            f"Selector '{current_selector}' not found. UI may have changed.",
+            suggested_fix, 0.7 if alternative_selectors else 0.3
+        )
+    
+    async def suggest_timeout_repair(self, failure: WorkflowFailure, 
+                                   failing_step: Dict[str, Any]) -> RepairSuggestion:
+        """
+        Suggest repairs for timeout issues
+        """
+        args = failing_step.get('args') or _EMPTY_ARGS
+        
+        # Increase timeout or add wait conditions
+        suggested_fix = {
+            **failing_step,
+            "args": {**args, "timeout": args.get('timeout', 30) * 2, "wait_for_load": True}
+        }
+        
+        return self._make_suggestion(
+            failure, "timeout",
+            "Operation timed out. Page may be loading slowly.",
+            suggested_fix, 0.6
+        )
+    
+    async def suggest_network_repair(self, failure: WorkflowFailure, 
+                                   failing_step: Dict[str, Any]) -> RepairSuggestion:
+        """
+        Suggest repairs for network issues
+        """
+        # Add retry logic and error handling
+        suggested_fix = {**failing_step, "retry_count": 3, "retry_delay": 5}
+        
+        return self._make_suggestion(
+            failure, "network_error",
+            "Network connectivity issue. Adding retry logic.",
+            suggested_fix, 0.5
+        )
+    
+    async def suggest_auth_repair(self, failure: WorkflowFailure, 
+                                failing_step: Dict[str, Any]) -> RepairSuggestion:
+        """
+        Suggest repairs for authentication issues
+        """
+        # Add authentication step before the failing step
+        auth_step = {
+            "action": "authenticate",
+            "args": {
+                "check_login_state": True,
+                "re_authenticate": True
+            }
+        }
+        
+        # Suggest adding auth step before current step
+        return self._make_suggestion(
+            failure, "authentication_failure",
+            "Authentication required. Adding login verification step.",
+            auth_step, 0.8
+        )
+    
+    async def suggest_generic_repair(self, failure: WorkflowFailure, 
+                                   failing_step: Dict[str, Any]) -> RepairSuggestion:
+        """
+        Use AI agent for generic repair suggestions
+        """
+        if not self.repair_agent:
+            # Fallback to basic suggestion (a copy, never the registry's own step dict)
+            return self._make_suggestion(
+                failure, "unknown_error",
+                f"Unknown error: {failure.error_message}",
+                copy.deepcopy(failing_step), 0.2
+            )
+        
+        # Use AI agent to analyze and suggest repair
+        task = f"Analyze workflow failure: {failure.error_message} in step {failing_step}. Suggest a repair."
+        
+        try:
+            # This would use the actual AI agent in real implementation
+            # result = await self.repair_agent.run()
+            
+            # For now, return a generic suggestion
+            return self._make_suggestion(
+                failure, "generic_error",
+                f"AI-analyzed error: {failure.error_message}",
+                copy.deepcopy(failing_step), 0.6
+            )
+            
+        except Exception as e:
+            logger.error("❌ AI repair suggestion failed: %s", e)
+            return None
+    
+    async def get_ai_selector_suggestion(self, failure: WorkflowFailure, 
+                                       failing_step: Dict[str, Any]) -> Optional[str]:
+        """
+        Use AI to suggest better selectors based on DOM analysis
+        """
+        if not self.repair_agent:
+            return None
+        
+        try:
+            # This would use screenshot and DOM analysis in real implementation
+            # For now, return a smart guess based on current selector
+            current_selector = (failing_step.get('args') or _EMPTY_ARGS).get('selector', '')
+            
+            # Simple heuristic improvements
+            for pattern, replacement in _SELECTOR_HEURISTICS:
+                if pattern.search(current_selector):
+                    return replacement
+            
+            return None
+            
+        except Exception:
+            return None
+    
+    async def save_repair_suggestion(self, suggestion: RepairSuggestion):
+        """
+        Queue repair suggestion to be saved for human review
+        """
+        # Queue and saver are created together lazily, inside the running loop,
+        # since the engine may be constructed outside one
+        if self._saver_task is None or self._saver_task.done():
+            self._save_queue = asyncio.Queue()
+            self._saver_task = asyncio.create_task(self._save_loop(self._save_queue))
+        self._save_queue.put_nowait(suggestion)
+    
+    async def flush_repair_suggestions(self):
+        """
+        Wait until every queued repair suggestion has been written
+        
+        Call before shutdown, otherwise suggestions still queued are lost.
+        """
+        if self._saver_task is not None and not self._saver_task.done():
+            await self._save_queue.join()
+    
+    async def _save_loop(self, queue: asyncio.Queue):
+        """
+        Collect queued suggestions into batches and write each batch off the event loop
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + self.save_batch_window
+            while len(batch) < self.save_batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), remaining))
+                except TimeoutError:
+                    break
+            
+            try:
+                await asyncio.to_thread(self._write_batch, batch)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+    
+    def _write_batch(self, batch: List[RepairSuggestion]):
+        """
+        Write a batch of repair suggestions, one JSON file each
+        """
+        stamp = time.time_ns()
+        for suggestion in batch:
+            try:
+                # Counter keeps names unique within a batch sharing one timestamp
+                suggestion_file = self.repairs_dir / f"{suggestion.workflow_name}_{suggestion.step_index}_{stamp}_{next(self._save_counter)}.json"
+                
+                # orjson serializes the dataclass straight to bytes for a single write
+                suggestion_file.write_bytes(orjson.dumps(suggestion, option=orjson.OPT_INDENT_2))
+                
+                logger.info("💾 Repair suggestion saved: %s", suggestion_file)
+                
+            except Exception as e:
+                logger.error("❌ Failed to save repair suggestion: %s", e)
+    
+    async def apply_repair(self, suggestion: RepairSuggestion, approved: bool = False) -> Dict[str, Any]:
+        """
+        Apply a repair suggestion to the workflow (requires approval)
+        """
+        if not approved:
+            return {
+                "success": False,
+                "error": "Repair requires human approval"
+            }
+        
+        try:
+            # Get the workflow
+            workflow = self.registry.get_workflow(suggestion.workflow_name)
+            if not workflow:
+                return {"success": False, "error": "Workflow not found"}
+            
+            # Apply the fix
+            if suggestion.step_index < len(workflow.steps):
+                workflow.steps[suggestion.step_index] = suggestion.suggested_fix
+                
+                # Save updated workflow
+                if self.registry.save_workflow(workflow):
+                    # Cached suggestions were derived from the old steps
+                    self._suggestion_cache.clear()
+                    logger.info("✅ Applied repair to %s at step %s", suggestion.workflow_name, suggestion.step_index)
+                    return {
+                        "success": True,
+                        "message": "Repair applied successfully",
+                        "workflow_updated": True
+                    }
+            
+            return {"success": False, "error": "Could not apply repair"}
+            
+        except Exception as e:
+            return {"success": False, "error": f"Repair application failed: {str(e)}"}
+    
+    @staticmethod
+    def _append_indexed(history: deque, by_workflow: Dict[str, deque], entry: Any):
+        """
+        Append to a bounded history and its per-workflow index, evicting from both together
+        """
+        if len(history) == history.maxlen:
+            # The global oldest entry is also the oldest of its workflow's index
+            oldest = history[0]
+            index = by_workflow[oldest.workflow_name]
+            index.popleft()
+            if not index:
+                del by_workflow[oldest.workflow_name]
+        history.append(entry)
+        by_workflow[entry.workflow_name].append(entry)
+    
+    def get_repair_suggestions(self, workflow_name: Optional[str] = None) -> List[RepairSuggestion]:
+        """
+        Get all repair suggestions, optionally filtered by workflow
+        """
+        if workflow_name:
+            return list(self._suggestions_by_wf.get(workflow_name, ()))
+        return list(self.repair_suggestions)
+    
+    def get_failure_history(self, workflow_name: Optional[str] = None) -> List[WorkflowFailure]:
+        """
+        Get failure history, optionally filtered by workflow
+        """
+        if workflow_name:
+            return list(self._failures_by_wf.get(workflow_name, ()))
+        return list(self.failures_log)
+
+
+# Example usage and test
+async def test_self_healing():
+    """Test the self-healing mechanism"""
+    print("🧪 Testing Self-Healing Engine...")
+    
+    registry = WorkflowRegistry()
+    registry.create_sample_workflows()
+    
+    healing_engine = SelfHealingEngine(registry)
+    
+    # Simulate a workflow failure
+    mock_error = Exception("Element not found: #old-selector")
+    
+    result = await healing_engine.handle_workflow_failure(
+        "test_navigation", 
+        0, 
+        mock_error,
+        {"screenshot_path": "error_screenshot.png"}
+    )
+    
+    print(f"🔧 Failure handling result: {result}")
+    await healing_engine.flush_repair_suggestions()
+    
+    # Get repair suggestions
+    suggestions = healing_engine.get_repair_suggestions()
+    print(f"💡 Repair suggestions: {len(suggestions)}")
+    
+    for suggestion in suggestions:
+        print(f"  - {suggestion.issue_type}: {suggestion.issue_description}")
+        print(f"    Confidence: {suggestion.confidence_score}")
+    
+    print("✅ Self-healing tests completed")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    asyncio.run(test_self_healing())
\ No newline at end of file
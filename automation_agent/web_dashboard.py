@@ -4,233 +4,47 @@ Web Dashboard for monitoring workflow executions
 """
 
 import asyncio
-from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional
-import json
-from pathlib import Path
+import gzip
+import time
+from collections import deque
+from itertools import islice
+from typing import Dict, Any, List, Optional, Set, Tuple
 
+import orjson
 from fastapi import FastAPI, Request, WebSocket, WebSocketDisconnect
-from fastapi.responses import HTMLResponse, JSONResponse
-from fastapi.staticfiles import StaticFiles
-from fastapi.templating import Jinja2Templates
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response
 import uvicorn
 
-from mcp_server import MCPServer
-from workflow_registry import WorkflowRegistry
-from router import Router
-from self_healing import SelfHealingEngine
+from .mcp_server import MCPServer
+from .workflow_registry import WorkflowRegistry
+from .router import Router
+from .self_healing import RepairSuggestion, SelfHealingEngine
 
+try:
+    import uvloop
+    _HAS_UVLOOP = True
+except ImportError:
+    _HAS_UVLOOP = False
 
-class DashboardServer:
-    """
-    Web dashboard server for monitoring and managing workflows
-    """
-    
-    def __init__(self):
-        self.app = FastAPI(title="Browser Automation Dashboard")
-        self.registry = WorkflowRegistry()
-        self.mcp_server = MCPServer()
-        self.router = Router()
-        self.healing_engine = SelfHealingEngine(self.registry)
-        
-        # WebSocket connections for real-time updates
-        self.active_connections: List[WebSocket] = []
-        
-        # Execution history
-        self.execution_history = []
-        
-        # Setup routes
-        self.setup_routes()
-        
-        # Create templates directory
-        self.templates_dir = Path("templates")
-        self.templates_dir.mkdir(exist_ok=True)
-        self.templates = Jinja2Templates(directory="templates")
-        
-        # Create static files directory
-        self.static_dir = Path("static")
-        self.static_dir.mkdir(exist_ok=True)
-        
-        # Mount static files
-        self.app.mount("/static", StaticFiles(directory="static"), name="static")
-        
-        # Create dashboard templates
-        self.create_templates()
-    
-    def setup_routes(self):
-        """Setup FastAPI routes"""
-        
-        @self.app.get("/", response_class=HTMLResponse)
-        async def dashboard_home(request: Request):
-            return self.templates.TemplateResponse("dashboard.html", {
-                "request": request,
-                "page_title": "Browser Automation Dashboard"
-            })
-        
-        @self.app.get("/api/workflows")
-        async def get_workflows():
-            workflows = self.registry.list_workflows()
-            return JSONResponse({"workflows": workflows})
-        
-        @self.app.get("/api/workflow/{workflow_name}")
-        async def get_workflow(workflow_name: str):
-            workflow = self.registry.get_workflow(workflow_name)
-            if workflow:
-                return JSONResponse({
-                    "workflow": {
-                        "name": workflow.name,
-                        "version": workflow.version,
-                        "domain": workflow.domain,
-                        "steps": workflow.steps,
-                        "variables": workflow.variables,
-                        "metadata": workflow.metadata
-                    }
-                })
-            return JSONResponse({"error": "Workflow not found"}, status_code=404)
-        
-        @self.app.post("/api/workflow/{workflow_name}/run")
-        async def run_workflow(workflow_name: str, variables: Dict[str, Any] = None):
-            try:
-                result = await self.mcp_server.run_workflow(workflow_name, variables or {})
-                
-                # Record execution
-                execution_record = {
-                    "workflow_name": workflow_name,
-                    "timestamp": datetime.now().isoformat(),
-                    "variables": variables,
-                    "result": result,
-                    "status": "success" if result.get("success") else "failed"
-                }
-                self.execution_history.append(execution_record)
-                
-                # Broadcast to WebSocket clients
-                await self.broadcast_execution_update(execution_record)
-                
-                return JSONResponse(result)
-            except Exception as e:
-                error_record = {
-                    "workflow_name": workflow_name,
-                    "timestamp": datetime.now().isoformat(),
-                    "variables": variables,
-                    "error": str(e),
-                    "status": "error"
-                }
-                self.execution_history.append(error_record)
-                await self.broadcast_execution_update(error_record)
-                
-                return JSONResponse({"success": False, "error": str(e)}, status_code=500)
-        
-        @self.app.post("/api/prompt")
-        async def handle_prompt(prompt_data: Dict[str, str]):
-            try:
-                prompt = prompt_data.get("prompt", "")
-                result = await self.router.handle_prompt(prompt)
-                
-                # Record execution
-                execution_record = {
-                    "prompt": prompt,
-                    "timestamp": datetime.now().isoformat(),
-                    "result": result,
-                    "status": "success" if result.get("success") else "failed",
-                    "source": result.get("source", "unknown")
-                }
-                self.execution_history.append(execution_record)
-                await self.broadcast_execution_update(execution_record)
-                
-                return JSONResponse(result)
-            except Exception as e:
-                return JSONResponse({"success": False, "error": str(e)}, status_code=500)
-        
-        @self.app.get("/api/executions")
-        async def get_executions(limit: int = 50):
-            recent_executions = self.execution_history[-limit:] if self.execution_history else []
-            return JSONResponse({"executions": recent_executions})
-        
-        @self.app.get("/api/repair-suggestions")
-        async def get_repair_suggestions():
-            suggestions = self.healing_engine.get_repair_suggestions()
-            return JSONResponse({
-                "suggestions": [
-                    {
-                        "workflow_name": s.workflow_name,
-                        "step_index": s.step_index,
-                        "issue_type": s.issue_type,
-                        "issue_description": s.issue_description,
-                        "confidence_score": s.confidence_score,
-                        "timestamp": s.timestamp
-                    }
-                    for s in suggestions
-                ]
-            })
-        
-        @self.app.post("/api/repair-suggestions/{suggestion_id}/apply")
-        async def apply_repair_suggestion(suggestion_id: int, approval_data: Dict[str, bool]):
-            try:
-                approved = approval_data.get("approved", False)
-                suggestions = self.healing_engine.get_repair_suggestions()
-                
-                if 0 <= suggestion_id < len(suggestions):
-                    suggestion = suggestions[suggestion_id]
-                    result = await self.healing_engine.apply_repair(suggestion, approved)
-                    return JSONResponse(result)
-                
-                return JSONResponse({"success": False, "error": "Suggestion not found"}, status_code=404)
-            except Exception as e:
-                return JSONResponse({"success": False, "error": str(e)}, status_code=500)
-        
-        @self.app.get("/api/stats")
-        async def get_dashboard_stats():
-            now = datetime.now()
-            last_24h = now - timedelta(hours=24)
-            
-            recent_executions = [
-                e for e in self.execution_history 
-                if datetime.fromisoformat(e["timestamp"]) >= last_24h
-            ]
-            
-            success_count = sum(1 for e in recent_executions if e.get("status") == "success")
-            failed_count = sum(1 for e in recent_executions if e.get("status") in ["failed", "error"])
-            
-            return JSONResponse({
-                "total_workflows": len(self.registry.workflows),
-                "total_executions": len(self.execution_history),
-                "executions_24h": len(recent_executions),
-                "success_rate_24h": (success_count / len(recent_executions) * 100) if recent_executions else 0,
-                "failed_executions_24h": failed_count,
-                "repair_suggestions": len(self.healing_engine.get_repair_suggestions())
-            })
-        
-        @self.app.websocket("/ws")
-        async def websocket_endpoint(websocket: WebSocket):
-            await websocket.accept()
-            self.active_connections.append(websocket)
-            try:
-                while True:
-                    # Keep connection alive and handle messages
-                    data = await websocket.receive_text()
-                    # Echo back for now
-                    await websocket.send_text(f"Echo: {data}")
-            except WebSocketDisconnect:
-                self.active_connections.remove(websocket)
-    
-    async def broadcast_execution_update(self, execution_record: Dict[str, Any]):
-        """Broadcast execution updates to all connected WebSocket clients"""
-        message = json.dumps({
-            "type": "execution_update",
-            "data": execution_record
-        })
-        
-        for connection in self.active_connections.copy():
-            try:
-                await connection.send_text(message)
-            except:
-                # Remove disconnected clients
-                self.active_connections.remove(connection)
-    
-    def create_templates(self):
-        """Create HTML templates for the dashboard"""
-        
-        dashboard_html = """
+_STATS_WINDOW_SECONDS = 24 * 60 * 60
+_FAILED_STATUSES = frozenset(("failed", "error"))
+
+# Responses with more items than this are serialized in a worker thread
+_OFFLOAD_ITEMS_THRESHOLD = 200
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+# Constant error bodies, serialized once
+_WORKFLOW_NOT_FOUND = orjson.dumps({"error": "Workflow not found"})
+_SUGGESTION_NOT_FOUND = orjson.dumps({"success": False, "error": "Suggestion not found"})
+
+# {"type": "execution_update", "data": <record>} with the constant envelope pre-encoded
+_UPDATE_ENVELOPE_PREFIX = b'{"type":"execution_update","data":'
+_UPDATE_ENVELOPE_SUFFIX = b'}'
+
+_DASHBOARD_TITLE = "Browser Automation Dashboard"
+
+_DASHBOARD_HTML = """
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -427,8 +241,10 @@ class DashboardServer:
         // WebSocket connection
         const ws = new WebSocket(`ws://${window.location.host}/ws`);
         
-        ws.onmessage = function(event) {
-            const data = JSON.parse(event.data);
+        ws.onmessage = async function(event) {
+            // Updates arrive as binary frames, echoes as text
+            const text = typeof event.data === 'string' ? event.data : await event.data.text();
+            const data = JSON.parse(text);
             if (data.type === 'execution_update') {
                 addExecutionLogEntry(data.data);
                 updateStats();
@@ -515,7 +331,7 @@ class DashboardServer:
                         <strong>${suggestion.workflow_name}</strong> - Step ${suggestion.step_index}
                         <br><small>${suggestion.issue_description}</small>
                         <br><span class="status">Confidence: ${(suggestion.confidence_score * 100).toFixed(0)}%</span>
-                        <button onclick="applyRepair(${index})" class="btn btn-small" style="margin-left: 1rem;">Apply Fix</button>
+                        <button onclick='applyRepair(${index}, ${JSON.stringify(suggestion.workflow_name)}, ${suggestion.step_index}, ${JSON.stringify(suggestion.timestamp)})' class="btn btn-small" style="margin-left: 1rem;">Apply Fix</button>
                     </div>
                 `).join('');
             } catch (error) {
@@ -590,7 +406,7 @@ class DashboardServer:
             }
         }
 
-        async function applyRepair(suggestionIndex) {
+        async function applyRepair(suggestionIndex, workflowName, stepIndex, timestamp) {
             if (!confirm('Are you sure you want to apply this repair? This will modify the workflow.')) {
                 return;
             }
@@ -599,7 +415,8 @@ class DashboardServer:
                 const response = await fetch(`/api/repair-suggestions/${suggestionIndex}/apply`, {
                     method: 'POST',
                     headers: {'Content-Type': 'application/json'},
-                    body: JSON.stringify({approved: true})
+                    // The key lets the server find this exact suggestion if the list has changed
+                    body: JSON.stringify({approved: true, workflow_name: workflowName, step_index: stepIndex, timestamp: timestamp})
                 });
                 
                 const result = await response.json();
@@ -624,18 +441,301 @@ class DashboardServer:
     </script>
 </body>
 </html>
-        """
+"""
+
+# The page has no per-request state, so it is rendered and encoded once
+_DASHBOARD_BYTES = _DASHBOARD_HTML.replace("{{ page_title }}", _DASHBOARD_TITLE).encode("utf-8")
+_HTML_MEDIA_TYPE = "text/html; charset=utf-8"
+_DASHBOARD_HEADERS = {"Cache-Control": "public, max-age=300", "Vary": "Accept-Encoding"}
+_DASHBOARD_GZ = gzip.compress(_DASHBOARD_BYTES, 9)
+_DASHBOARD_GZ_HEADERS = {**_DASHBOARD_HEADERS, "Content-Encoding": "gzip"}
+
+# (epoch second, ISO string) of the last formatted execution timestamp
+_ts_cache = [0, ""]
+
+
+def _iso_timestamp(epoch: float) -> str:
+    """Second-resolution local ISO timestamp, formatted at most once per second"""
+    t = int(epoch)
+    if t != _ts_cache[0]:
+        _ts_cache[:] = [t, time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(t))]
+    return _ts_cache[1]
+
+
+def _suggestion_key(suggestion: RepairSuggestion) -> Tuple[str, int, str]:
+    """Identity of a repair suggestion that survives snapshot refreshes"""
+    return suggestion.workflow_name, suggestion.step_index, suggestion.timestamp
+
+
+async def _json_response(content: Dict[str, Any], items: int) -> Response:
+    """JSON response that keeps large serializations off the event loop"""
+    if items > _OFFLOAD_ITEMS_THRESHOLD:
+        body = await asyncio.to_thread(orjson.dumps, content, option=_ORJSON_OPTIONS)
+        return Response(body, media_type="application/json")
+    return ORJSONResponse(content)
+
+
+class DashboardServer:
+    """
+    Web dashboard server for monitoring and managing workflows
+    """
+    
+    # WebSocket clients sent to concurrently per broadcast round
+    broadcast_chunk_size = 50
+    history_size = 10_000
+    # Seconds the dashboard reuses one snapshot of the healing engine's suggestions
+    repair_cache_ttl = 2.0
+    
+    def __init__(self):
+        self.app = FastAPI(title=_DASHBOARD_TITLE, default_response_class=ORJSONResponse)
+        # Compresses larger API listings; the dashboard page is already precompressed
+        self.app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=6)
+        self.registry = WorkflowRegistry()
+        self.mcp_server = MCPServer()
+        self.router = Router()
+        self.healing_engine = SelfHealingEngine(self.registry)
+        
+        # WebSocket connections for real-time updates
+        self.active_connections: Set[WebSocket] = set()
+        
+        # Execution history, oldest entries evicted past history_size
+        self.execution_history: deque = deque(maxlen=self.history_size)
+        self._total_executions = 0
+        
+        # Rolling 24h window of (epoch, status) with running counts for /api/stats
+        self._stats_window: deque = deque()
+        self._success_24h = 0
+        self._failed_24h = 0
+        
+        # (expiry, version, suggestions) snapshot; version is bumped when a repair is applied
+        self._repair_version = 0
+        self._repair_cache: Optional[Tuple[float, int, List[RepairSuggestion]]] = None
+        
+        # Setup routes
+        self.setup_routes()
+    
+    def setup_routes(self):
+        """Setup FastAPI routes"""
+        
+        @self.app.get("/", response_class=Response)
+        async def dashboard_home(request: Request):
+            if "gzip" in request.headers.get("accept-encoding", ""):
+                return Response(_DASHBOARD_GZ, media_type=_HTML_MEDIA_TYPE, headers=_DASHBOARD_GZ_HEADERS)
+            return Response(_DASHBOARD_BYTES, media_type=_HTML_MEDIA_TYPE, headers=_DASHBOARD_HEADERS)
+        
+        @self.app.get("/api/workflows")
+        async def get_workflows():
+            workflows = self.registry.list_workflows()
+            return await _json_response({"workflows": workflows}, len(workflows))
+        
+        @self.app.get("/api/workflow/{workflow_name}")
+        async def get_workflow(workflow_name: str):
+            workflow = self.registry.get_workflow(workflow_name)
+            if workflow:
+                return ORJSONResponse({
+                    "workflow": {
+                        "name": workflow.name,
+                        "version": workflow.version,
+                        "domain": workflow.domain,
+                        "steps": workflow.steps,
+                        "variables": workflow.variables,
+                        "metadata": workflow.metadata
+                    }
+                })
+            return Response(_WORKFLOW_NOT_FOUND, status_code=404, media_type="application/json")
+        
+        @self.app.post("/api/workflow/{workflow_name}/run")
+        async def run_workflow(workflow_name: str, variables: Dict[str, Any] = None):
+            try:
+                result = await self.mcp_server.run_workflow(workflow_name, variables or {})
+                
+                # Record execution
+                now = time.time()
+                execution_record = {
+                    "workflow_name": workflow_name,
+                    "timestamp": _iso_timestamp(now),
+                    "variables": variables,
+                    "result": result,
+                    "status": "success" if result.get("success") else "failed"
+                }
+                self._record_execution(execution_record, now)
+                
+                # Broadcast to WebSocket clients
+                await self.broadcast_execution_update(execution_record)
+                
+                return ORJSONResponse(result)
+            except Exception as e:
+                now = time.time()
+                error_record = {
+                    "workflow_name": workflow_name,
+                    "timestamp": _iso_timestamp(now),
+                    "variables": variables,
+                    "error": str(e),
+                    "status": "error"
+                }
+                self._record_execution(error_record, now)
+                await self.broadcast_execution_update(error_record)
+                
+                return ORJSONResponse({"success": False, "error": str(e)}, status_code=500)
+        
+        @self.app.post("/api/prompt")
+        async def handle_prompt(prompt_data: Dict[str, str]):
+            try:
+                prompt = prompt_data.get("prompt", "")
+                result = await self.router.handle_prompt(prompt)
+                
+                # Record execution
+                now = time.time()
+                execution_record = {
+                    "prompt": prompt,
+                    "timestamp": _iso_timestamp(now),
+                    "result": result,
+                    "status": "success" if result.get("success") else "failed",
+                    "source": result.get("source", "unknown")
+                }
+                self._record_execution(execution_record, now)
+                await self.broadcast_execution_update(execution_record)
+                
+                return ORJSONResponse(result)
+            except Exception as e:
+                return ORJSONResponse({"success": False, "error": str(e)}, status_code=500)
+        
+        @self.app.get("/api/executions")
+        async def get_executions(limit: int = 50):
+            history = self.execution_history
+            recent_executions = list(islice(history, max(0, len(history) - limit), None)) if limit > 0 else []
+            return await _json_response({"executions": recent_executions}, len(recent_executions))
+        
+        @self.app.get("/api/repair-suggestions")
+        async def get_repair_suggestions():
+            suggestions = self._cached_repair_suggestions()
+            # orjson serializes the slotted RepairSuggestion dataclasses natively
+            return await _json_response({"suggestions": suggestions}, len(suggestions))
+        
+        @self.app.post("/api/repair-suggestions/{suggestion_id}/apply")
+        async def apply_repair_suggestion(suggestion_id: int, approval_data: Dict[str, Any]):
+            try:
+                approved = approval_data.get("approved", False)
+                # Indexes in the UI come from this same cached snapshot
+                suggestions = self._cached_repair_suggestions()
+                suggestion = suggestions[suggestion_id] if 0 <= suggestion_id < len(suggestions) else None
+                
+                if "workflow_name" in approval_data:
+                    key = (approval_data["workflow_name"], approval_data.get("step_index"), approval_data.get("timestamp"))
+                    if suggestion is None or _suggestion_key(suggestion) != key:
+                        # The snapshot was refreshed since the UI rendered it; match on the stable key
+                        suggestion = next((s for s in suggestions if _suggestion_key(s) == key), None)
+                
+                if suggestion is not None:
+                    result = await self.healing_engine.apply_repair(suggestion, approved)
+                    if result.get("success"):
+                        self._repair_version += 1
+                    return ORJSONResponse(result)
+                
+                return Response(_SUGGESTION_NOT_FOUND, status_code=404, media_type="application/json")
+            except Exception as e:
+                return ORJSONResponse({"success": False, "error": str(e)}, status_code=500)
+        
+        @self.app.get("/api/stats")
+        async def get_dashboard_stats():
+            self._expire_stats_window()
+            executions_24h = len(self._stats_window)
+            
+            return ORJSONResponse({
+                "total_workflows": len(self.registry.workflows),
+                "total_executions": self._total_executions,
+                "executions_24h": executions_24h,
+                "success_rate_24h": (self._success_24h / executions_24h * 100) if executions_24h else 0,
+                "failed_executions_24h": self._failed_24h,
+                "repair_suggestions": len(self._cached_repair_suggestions())
+            })
+        
+        @self.app.websocket("/ws")
+        async def websocket_endpoint(websocket: WebSocket):
+            await websocket.accept()
+            self.active_connections.add(websocket)
+            try:
+                while True:
+                    # Keep connection alive and handle messages
+                    data = await websocket.receive_text()
+                    # Echo back for now
+                    await websocket.send_text(f"Echo: {data}")
+            except WebSocketDisconnect:
+                pass
+            finally:
+                # Also covers abnormal closes that surface as other errors
+                self.active_connections.discard(websocket)
+    
+    def _cached_repair_suggestions(self) -> List[RepairSuggestion]:
+        """Repair suggestions snapshot, refreshed after the TTL or an applied repair"""
+        now = time.monotonic()
+        cached = self._repair_cache
+        if cached is not None and now < cached[0] and cached[1] == self._repair_version:
+            return cached[2]
+        
+        suggestions = self.healing_engine.get_repair_suggestions()
+        self._repair_cache = (now + self.repair_cache_ttl, self._repair_version, suggestions)
+        return suggestions
+    
+    def _record_execution(self, record: Dict[str, Any], epoch: float):
+        """Append an execution to the history and its epoch to the rolling stats window"""
+        self.execution_history.append(record)
+        self._total_executions += 1
+        
+        status = record["status"]
+        self._stats_window.append((epoch, status))
+        if status == "success":
+            self._success_24h += 1
+        elif status in _FAILED_STATUSES:
+            self._failed_24h += 1
+    
+    def _expire_stats_window(self):
+        """Drop executions older than 24 hours from the rolling stats counters"""
+        cutoff = time.time() - _STATS_WINDOW_SECONDS
+        window = self._stats_window
+        while window and window[0][0] < cutoff:
+            _, status = window.popleft()
+            if status == "success":
+                self._success_24h -= 1
+            elif status in _FAILED_STATUSES:
+                self._failed_24h -= 1
+    
+    async def broadcast_execution_update(self, execution_record: Dict[str, Any]):
+        """Broadcast execution updates to all connected WebSocket clients"""
+        message = _UPDATE_ENVELOPE_PREFIX + orjson.dumps(execution_record) + _UPDATE_ENVELOPE_SUFFIX
+        
+        connections = list(self.active_connections)
+        dead = set()
+        for start in range(0, len(connections), self.broadcast_chunk_size):
+            if start:
+                # Yield to the event loop between chunks of a large fanout
+                await asyncio.sleep(0)
+            chunk = connections[start:start + self.broadcast_chunk_size]
+            results = await asyncio.gather(
+                *(connection.send_bytes(message) for connection in chunk),
+                return_exceptions=True
+            )
+            dead.update(
+                connection for connection, result in zip(chunk, results)
+                if isinstance(result, Exception)
+            )
         
-        # Write the dashboard template
-        with open(self.templates_dir / "dashboard.html", "w") as f:
-            f.write(dashboard_html)
+        # Remove disconnected clients
+        self.active_connections -= dead
     
     async def start_server(self, host: str = "0.0.0.0", port: int = 8000):
         """Start the dashboard server"""
         print(f"🌐 Starting dashboard server at http://{host}:{port}")
-        config = uvicorn.Config(self.app, host=host, port=port, log_level="info")
+        config = uvicorn.Config(
+            self.app, host=host, port=port, log_level="info",
+            loop="uvloop" if _HAS_UVLOOP else "asyncio", http="httptools", ws="websockets"
+        )
         server = uvicorn.Server(config)
-        await server.serve()
+        try:
+            await server.serve()
+        finally:
+            # Don't drop repair suggestions still queued for writing
+            await self.healing_engine.flush_repair_suggestions()
 
 
 # Main function to run the dashboard
@@ -654,4 +754,7 @@ async def run_dashboard():
 
 
 if __name__ == "__main__":
+    # The loop policy is process-wide, so only the entry point installs it
+    if _HAS_UVLOOP:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     asyncio.run(run_dashboard())
\ No newline at end of file
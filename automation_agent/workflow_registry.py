@@ -0,0 +1,448 @@
+#!/usr/bin/env python3
+"""
+Workflow Registry - Stores and manages workflow specifications
+"""
+
+import logging
+import os
+import sys
+import orjson
+import yaml
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple
+from dataclasses import dataclass, field
+from datetime import datetime
+import uuid
+from bisect import bisect_right
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+# libyaml-backed loader/dumper when available, pure-Python otherwise
+_YAMLLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAMLDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Parsed workflows keyed by file name and (mtime_ns, size), so unchanged files skip YAML parsing.
+# Stored as plain JSON (never pickle) since agents and users write to the workflows dir.
+_PARSE_CACHE_FILE = ".cache.json"
+_PARSE_CACHE_VERSION = 3
+
+
+@dataclass(slots=True, frozen=True)
+class WorkflowSpec:
+    """Workflow specification"""
+    name: str
+    version: str
+    domain: Optional[str]
+    variables: Dict[str, str]
+    steps: List[Dict[str, Any]]
+    metadata: Dict[str, Any]
+
+
+def _represent_workflow_spec(dumper, spec: WorkflowSpec):
+    """Dump a spec as a plain mapping, keys pre-sorted as yaml.dump would sort them"""
+    return dumper.represent_mapping('tag:yaml.org,2002:map', (
+        ('domain', spec.domain),
+        ('metadata', spec.metadata),
+        ('name', spec.name),
+        ('steps', spec.steps),
+        ('variables', spec.variables),
+        ('version', spec.version),
+    ))
+
+
+yaml.add_representer(WorkflowSpec, _represent_workflow_spec, Dumper=_YAMLDumper)
+
+
+def _intern_strings(workflow_data: Dict[str, Any]):
+    """Intern the small-cardinality strings repeated across workflows, in place"""
+    for step in workflow_data.get('steps') or ():
+        if not isinstance(step, dict):
+            continue
+        action = step.get('action')
+        if isinstance(action, str):
+            step['action'] = sys.intern(action)
+        args = step.get('args')
+        if isinstance(args, dict):
+            step['args'] = {sys.intern(key) if isinstance(key, str) else key: value for key, value in args.items()}
+    
+    variables = workflow_data.get('variables')
+    if isinstance(variables, dict):
+        workflow_data['variables'] = {
+            sys.intern(key) if isinstance(key, str) else key: sys.intern(value) if isinstance(value, str) else value
+            for key, value in variables.items()
+        }
+
+
+def _parse_workflow_file(workflow_file: Path) -> Optional[WorkflowSpec]:
+    """Read one workflow YAML file into a spec (None for empty files)"""
+    with open(workflow_file, 'r') as f:
+        workflow_data = yaml.load(f, Loader=_YAMLLoader)
+    if not workflow_data:
+        return None
+    _intern_strings(workflow_data)
+    return WorkflowSpec(
+        name=workflow_data.get('name', workflow_file.stem),
+        version=workflow_data.get('version', '1.0'),
+        domain=workflow_data.get('domain'),
+        variables=workflow_data.get('variables', {}),
+        steps=workflow_data.get('steps', []),
+        metadata=workflow_data.get('metadata', {})
+    )
+
+
+@dataclass(slots=True)
+class _MatchColumns:
+    """Per-workflow match keys as parallel columns in registry order"""
+    specs: List[WorkflowSpec] = field(default_factory=list)
+    domains: List[Optional[str]] = field(default_factory=list)
+    names_lower: List[str] = field(default_factory=list)
+
+
+# Separator for joined match keys; queries containing it fall back to a plain scan
+_SEP = "\0"
+
+
+def _join_keys(keys) -> Tuple[str, List[int]]:
+    """Join keys with _SEP, returning the haystack and each key's start offset"""
+    starts = []
+    offset = 0
+    parts = []
+    for key in keys:
+        starts.append(offset)
+        parts.append(key)
+        offset += len(key) + 1
+    return _SEP.join(parts), starts
+
+
+def _first_match(haystack: str, starts: List[int], query: str) -> int:
+    """Index of the first key containing query, or len(starts) when none does"""
+    if not starts:
+        return 0
+    pos = haystack.find(query)
+    if pos < 0:
+        return len(starts)
+    return bisect_right(starts, pos) - 1
+
+
+def _try_parse_workflow_file(workflow_file: Path) -> Tuple[bool, Optional[WorkflowSpec]]:
+    """Parse one workflow file, logging failures so a bad file only skips itself"""
+    try:
+        return True, _parse_workflow_file(workflow_file)
+    except Exception as e:
+        logger.error("❌ Error loading workflow %s: %s", workflow_file.name, e)
+        return False, None
+
+
+class WorkflowRegistry:
+    """
+    Manages workflow storage, versioning and retrieval
+    """
+    
+    # Max (site, intent) lookups remembered by find_workflow
+    lookup_cache_size = 256
+    
+    def __init__(self, workflows_dir: str = "workflows"):
+        self.workflows_dir = Path(workflows_dir)
+        self.workflows_dir.mkdir(exist_ok=True)
+        # Filled lazily: single files by get_workflow, everything on first full access
+        self._workflows: Dict[str, WorkflowSpec] = {}
+        self._loaded = False
+        self._lookup_cache: "OrderedDict[tuple, Optional[WorkflowSpec]]" = OrderedDict()
+        self._list_cache: Optional[Tuple[Dict[str, Any], ...]] = None
+        self._columns = _MatchColumns()
+        # Same keys joined with _SEP into one string each, plus each entry's start offset,
+        # so a lookup is a single C-level str.find instead of a per-workflow loop
+        self._domain_haystack = ""
+        self._domain_starts: List[int] = []
+        self._name_haystack = ""
+        self._name_starts: List[int] = []
+    
+    @property
+    def workflows(self) -> Dict[str, WorkflowSpec]:
+        """All workflows by name, loaded from disk on first access"""
+        if not self._loaded:
+            self.load_all_workflows()
+        return self._workflows
+    
+    def load_all_workflows(self):
+        """Load all workflows from disk"""
+        self._lookup_cache.clear()
+        self._list_cache = None
+        try:
+            cache = self._read_parse_cache()
+            entries: Dict[str, Tuple[Tuple[int, int], Optional[WorkflowSpec]]] = {}
+            stale = []
+            # One directory listing instead of glob's pattern matching over Path objects
+            with os.scandir(self.workflows_dir) as it:
+                for entry in it:
+                    if not entry.name.endswith(".yaml") or not entry.is_file():
+                        continue
+                    st = entry.stat()
+                    stamp = (st.st_mtime_ns, st.st_size)
+                    cached = cache.get(entry.name)
+                    if cached is not None and cached[0] == stamp:
+                        entries[entry.name] = cached
+                    else:
+                        # Placeholder keeps directory order; filled in once parsed
+                        entries[entry.name] = (stamp, None)
+                        stale.append(Path(entry.path))
+            
+            if stale:
+                # Changed files are read and parsed in parallel; results are merged on this thread
+                with ThreadPoolExecutor(max_workers=min(32, len(stale))) as executor:
+                    for workflow_file, (ok, spec) in zip(stale, executor.map(_try_parse_workflow_file, stale)):
+                        if ok:
+                            entries[workflow_file.name] = (entries[workflow_file.name][0], spec)
+                        else:
+                            # Left out of the cache so the file is retried on the next load
+                            del entries[workflow_file.name]
+            
+            for _, spec in entries.values():
+                if spec:
+                    self._workflows[spec.name] = spec
+            
+            if stale or len(entries) != len(cache):
+                self._write_parse_cache(entries)
+            self._rebuild_indexes()
+            logger.info("📁 Loaded %d workflows", len(self._workflows))
+        except Exception as e:
+            logger.error("❌ Error loading workflows: %s", e)
+        self._loaded = True
+    
+    def _read_parse_cache(self) -> Dict[str, Tuple[Tuple[int, int], Optional[WorkflowSpec]]]:
+        """Parsed specs from the last load, keyed by file name with their (mtime_ns, size)"""
+        try:
+            data = orjson.loads((self.workflows_dir / _PARSE_CACHE_FILE).read_bytes())
+            if data.get("version") != _PARSE_CACHE_VERSION:
+                return {}
+            cache = {}
+            for file_name, (mtime_ns, size, fields) in data["entries"].items():
+                if fields is not None:
+                    _intern_strings(fields)
+                    fields = WorkflowSpec(**fields)
+                cache[file_name] = ((mtime_ns, size), fields)
+            return cache
+        except Exception:
+            # Missing, corrupt or written by an incompatible version
+            return {}
+    
+    def _write_parse_cache(self, entries: Dict[str, Tuple[Tuple[int, int], Optional[WorkflowSpec]]]):
+        """Atomically replace the parse cache"""
+        cache_path = self.workflows_dir / _PARSE_CACHE_FILE
+        tmp_path = cache_path.with_suffix(".tmp")
+        serializable = {}
+        for file_name, ((mtime_ns, size), spec) in entries.items():
+            fields = None if spec is None else {
+                'name': spec.name, 'version': spec.version, 'domain': spec.domain,
+                'variables': spec.variables, 'steps': spec.steps, 'metadata': spec.metadata,
+            }
+            try:
+                # Dates and non-string keys wouldn't round-trip, so those files are simply reparsed
+                orjson.dumps(fields, option=orjson.OPT_PASSTHROUGH_DATETIME)
+            except TypeError:
+                continue
+            serializable[file_name] = (mtime_ns, size, fields)
+        try:
+            tmp_path.write_bytes(orjson.dumps({"version": _PARSE_CACHE_VERSION, "entries": serializable}))
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            logger.warning("⚠️ Could not write workflow cache: %s", e)
+    
+    def _rebuild_indexes(self):
+        """Precompute per-workflow match keys after the registry changes"""
+        specs = list(self._workflows.values())
+        columns = _MatchColumns(
+            specs=specs,
+            domains=[workflow.domain for workflow in specs],
+            names_lower=[workflow.name.lower() for workflow in specs]
+        )
+        self._columns = columns
+        self._domain_haystack, self._domain_starts = _join_keys(domain or "" for domain in columns.domains)
+        self._name_haystack, self._name_starts = _join_keys(columns.names_lower)
+    
+    def find_workflow(self, site: Optional[str], intent: str) -> Optional[WorkflowSpec]:
+        """Find a workflow matching site and intent (LRU-cached until the registry changes)"""
+        if not self._loaded:
+            # Domains live inside the files, so matching needs every workflow
+            self.load_all_workflows()
+        key = (site or "", intent)
+        if key in self._lookup_cache:
+            self._lookup_cache.move_to_end(key)
+            return self._lookup_cache[key]
+        workflow = self._find_workflow(site, intent)
+        self._lookup_cache[key] = workflow
+        if len(self._lookup_cache) > self.lookup_cache_size:
+            self._lookup_cache.popitem(last=False)
+        return workflow
+    
+    def _find_workflow(self, site: Optional[str], intent: str) -> Optional[WorkflowSpec]:
+        """Find the first workflow whose domain contains site or whose name contains intent"""
+        intent_lower = intent.lower()
+        if _SEP not in intent_lower and (not site or _SEP not in site):
+            # The earliest entry matching either key wins, as in the scan below
+            candidates = [_first_match(self._name_haystack, self._name_starts, intent_lower)]
+            if site:
+                candidates.append(_first_match(self._domain_haystack, self._domain_starts, site))
+            index = min(candidates)
+            specs = self._columns.specs
+            return specs[index] if index < len(specs) else None
+        
+        columns = self._columns
+        for domain, name_lower, workflow in zip(columns.domains, columns.names_lower, columns.specs):
+            # Simple matching logic
+            if site and domain and site in domain:
+                return workflow
+            elif intent_lower in name_lower:
+                return workflow
+        return None
+    
+    def get_workflow(self, name: str) -> Optional[WorkflowSpec]:
+        """Get workflow by name"""
+        spec = self._workflows.get(name)
+        if spec is not None or self._loaded:
+            return spec
+        
+        # Before a full load, try just the file named after the workflow
+        workflow_path = self.workflows_dir / f"{name}.yaml"
+        try:
+            spec = _parse_workflow_file(workflow_path) if workflow_path.is_file() else None
+        except Exception as e:
+            logger.error("❌ Error loading workflow %s: %s", name, e)
+            spec = None
+        if spec is not None and spec.name == name:
+            self._workflows[name] = spec
+            return spec
+        
+        # Stored under a different file name (or missing): fall back to a full load
+        return self.workflows.get(name)
+    
+    def save_workflow(self, spec: WorkflowSpec) -> bool:
+        """Save workflow to disk"""
+        return self.save_many([spec])
+    
+    def save_many(self, specs: List[WorkflowSpec]) -> bool:
+        """Save workflows to disk atomically: write and fsync every temp file, then rename them all"""
+        written = []
+        try:
+            for spec in specs:
+                written.append(self._write_temp(spec))
+            for tmp_path, workflow_path in written:
+                os.replace(tmp_path, workflow_path)
+            self._fsync_dir()
+        except Exception as e:
+            for tmp_path, _ in written:
+                tmp_path.unlink(missing_ok=True)
+            logger.error("❌ Error saving workflow: %s", e)
+            return False
+        
+        for spec in specs:
+            self._workflows[spec.name] = spec
+            logger.info("💾 Saved workflow: %s", spec.name)
+        self._list_cache = None
+        if self._loaded:
+            self._lookup_cache.clear()
+            self._rebuild_indexes()
+        return True
+    
+    def _write_temp(self, spec: WorkflowSpec) -> Tuple[Path, Path]:
+        """Write a spec to a temp file beside its target and fsync it; returns (temp, target)"""
+        workflow_path = self.workflows_dir / f"{spec.name}.yaml"
+        tmp_path = workflow_path.with_name(workflow_path.name + ".tmp")
+        try:
+            with open(tmp_path, 'w') as f:
+                yaml.dump(spec, f, Dumper=_YAMLDumper, default_flow_style=False)
+                f.flush()
+                os.fsync(f.fileno())
+        except Exception:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        return tmp_path, workflow_path
+    
+    def _fsync_dir(self):
+        """Persist the renames in the workflows directory (POSIX only)"""
+        if os.name != "posix":
+            return
+        fd = os.open(self.workflows_dir, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+    
+    def create_sample_workflows(self):
+        """Create sample workflows for testing"""
+        created = datetime.now().isoformat()
+        
+        # Sample Jira workflow
+        jira_workflow = WorkflowSpec(
+            name="jira_ticket_export",
+            version="1.0",
+            domain="jira.company.com",
+            variables={
+                "project_key": "str",
+                "start_date": "str",
+                "end_date": "str"
+            },
+            steps=[
+                {
+                    "action": "navigate",
+                    "args": {"url": "https://example.com"}
+                },
+                {
+                    "action": "screenshot", 
+                    "args": {"path": "jira_export.png"}
+                }
+            ],
+            metadata={
+                "description": "Export Jira tickets for a project",
+                "created": created,
+                "sensitive": False
+            }
+        )
+        
+        # Sample test workflow
+        test_workflow = WorkflowSpec(
+            name="test_navigation",
+            version="1.0", 
+            domain="example.com",
+            variables={},
+            steps=[
+                {
+                    "action": "navigate",
+                    "args": {"url": "https://example.com"}
+                },
+                {
+                    "action": "screenshot",
+                    "args": {"path": "test.png"}
+                },
+                {
+                    "action": "extract",
+                    "args": {"selector": "h1"}
+                }
+            ],
+            metadata={
+                "description": "Simple test workflow",
+                "created": created,
+                "sensitive": False
+            }
+        )
+        
+        self.save_many([jira_workflow, test_workflow])
+        logger.info("📝 Created sample workflows")
+        
+    def list_workflows(self) -> Tuple[Dict[str, Any], ...]:
+        """List all workflows (shared snapshot rebuilt only after loads and saves; treat as read-only)"""
+        workflows = self.workflows
+        if self._list_cache is None:
+            self._list_cache = tuple(
+                {
+                    "name": spec.name,
+                    "version": spec.version,
+                    "domain": spec.domain,
+                    "description": spec.metadata.get('description', ''),
+                    "steps": len(spec.steps)
+                }
+                for spec in workflows.values()
+            )
+        return self._list_cache
\ No newline at end of file
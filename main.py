@@ -4,36 +4,56 @@ Main entry point for the Browser Automation Workflow System
 """
 
 import asyncio
+import logging
+import signal
 import sys
-import os
+from logging.handlers import MemoryHandler
 from pathlib import Path
 
-# Add src directory to path
-sys.path.insert(0, str(Path(__file__).parent / "src"))
+from automation_agent.mcp_server import MCPServer
+from automation_agent.llm_client import close_async_client
+from automation_agent.cli import cli, get_registry
 
-from mcp_server import MCPServer
-from workflow_registry import WorkflowRegistry
-from router import Router
-from cli import cli
+logger = logging.getLogger(__name__)
+
+
+def install_uvloop():
+    """Use uvloop's event loop when available (process-wide, so only done here at startup)"""
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
+def setup_logging():
+    """Route log records through a buffered handler that writes to stdout in batches"""
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+    buffered_handler = MemoryHandler(64, flushLevel=logging.ERROR, target=stream_handler)
+    
+    root = logging.getLogger()
+    root.addHandler(buffered_handler)
+    root.setLevel(logging.INFO)
 
 
 async def initialize_system():
     """Initialize the browser automation system"""
-    print("🚀 Initializing Browser Automation Workflow System...")
+    logger.info("🚀 Initializing Browser Automation Workflow System...")
     
     # Create workflows directory
     workflows_dir = Path("workflows")
     workflows_dir.mkdir(exist_ok=True)
     
     # Initialize workflow registry with sample workflows
-    registry = WorkflowRegistry()
+    registry = get_registry()
     registry.create_sample_workflows()
     
     # Initialize MCP server
     server = MCPServer()
     await server.initialize_browser()
     
-    print("✅ System initialized successfully")
+    logger.info("✅ System initialized successfully")
     return server, registry
 
 
@@ -42,48 +62,65 @@ async def run_server():
     server, registry = await initialize_system()
     
     try:
-        print("🔧 Testing system functionality...")
-        
-        # Test workflow listing
-        result = await server.execute_command("list_workflows", {})
-        print(f"📋 Available workflows: {result}")
+        logger.info("🔧 Testing system functionality...")
         
-        # Test navigation
-        result = await server.execute_command("navigate", {"url": "https://example.com"})
-        print(f"🌐 Navigation test: {result}")
+        # Workflow listing and navigation are independent, so probe them concurrently
+        async with asyncio.TaskGroup() as tg:
+            list_task = tg.create_task(server.execute_command("list_workflows", {}))
+            nav_task = tg.create_task(server.execute_command("navigate", {"url": "https://example.com"}))
+        logger.info("📋 Available workflows: %s", list_task.result())
+        logger.info("🌐 Navigation test: %s", nav_task.result())
         
-        # Test screenshot
+        # Test screenshot (depends on navigation)
         result = await server.execute_command("screenshot", {"path": "test_screenshot.png"})
-        print(f"📸 Screenshot test: {result}")
+        logger.info("📸 Screenshot test: %s", result)
         
         # Test workflow execution
         result = await server.execute_command("run_workflow", {"name": "test_navigation", "variables": {}})
-        print(f"⚙️ Workflow execution test: {result}")
+        logger.info("⚙️ Workflow execution test: %s", result)
         
-        print("✅ All tests completed successfully")
-        print("🎯 System is ready to handle requests")
+        logger.info("✅ All tests completed successfully")
+        logger.info("🎯 System is ready to handle requests")
         
-        # Keep server running
-        print("🖥️  Server running... (Press Ctrl+C to stop)")
-        while True:
-            await asyncio.sleep(1)
+        # Keep server running until SIGINT/SIGTERM
+        logger.info("🖥️  Server running... (Press Ctrl+C to stop)")
+        # Flush startup output before going idle
+        for handler in logging.getLogger().handlers:
+            handler.flush()
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        try:
+            loop.add_signal_handler(signal.SIGINT, stop.set)
+            loop.add_signal_handler(signal.SIGTERM, stop.set)
+            await stop.wait()
+        except NotImplementedError:
+            # Windows loops have no signal handlers; Ctrl+C cancels the wait instead
+            try:
+                await stop.wait()
+            except (KeyboardInterrupt, asyncio.CancelledError):
+                pass
+        logger.info("\n🛑 Shutting down server...")
             
-    except KeyboardInterrupt:
-        print("\n🛑 Shutting down server...")
     except Exception as e:
-        print(f"❌ Server error: {e}")
+        logger.error("❌ Server error: %s", e)
     finally:
         await server.cleanup()
+        await close_async_client()
 
 
 def main():
     """Main function - can be called from CLI or directly"""
+    install_uvloop()
     if len(sys.argv) > 1:
         # Run CLI commands
         cli()
     else:
         # Run server
-        asyncio.run(run_server())
+        setup_logging()
+        try:
+            asyncio.run(run_server())
+        finally:
+            logging.shutdown()
 
 
 if __name__ == "__main__":
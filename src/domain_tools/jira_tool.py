@@ -1,295 +0,0 @@
-#!/usr/bin/env python3
-"""
-Jira Domain Tool - Specialized adapter for Jira operations
-"""
-
-import asyncio
-from typing import Dict, Any, List, Optional
-from dataclasses import dataclass
-from browser_use import Agent
-import os
-
-
-@dataclass
-class JiraConfig:
-    """Jira configuration"""
-    base_url: str
-    username: Optional[str] = None
-    password: Optional[str] = None
-    token: Optional[str] = None
-
-
-class JiraTool:
-    """
-    Domain-specific tool for Jira automation with security constraints
-    """
-    
-    # Security configuration
-    allowed_domains = ["jira.company.com", "atlassian.net"]
-    has_sensitive_data = True
-    required_permissions = ["jira_read", "jira_export"]
-    
-    def __init__(self, config: JiraConfig, agent: Optional[Agent] = None):
-        self.config = config
-        self.agent = agent
-        self.session_active = False
-        
-        # Validate domain
-        if not any(domain in config.base_url for domain in self.allowed_domains):
-            raise ValueError(f"Domain not allowed. Must be one of: {self.allowed_domains}")
-    
-    async def login(self, username: Optional[str] = None, password: Optional[str] = None) -> Dict[str, Any]:
-        """
-        Secure login to Jira with credential validation
-        """
-        try:
-            # Use provided credentials or config defaults
-            username = username or self.config.username or os.getenv("JIRA_USER")
-            password = password or self.config.password or os.getenv("JIRA_PASS")
-            
-            if not username or not password:
-                return {
-                    "success": False,
-                    "error": "Missing credentials. Set JIRA_USER and JIRA_PASS environment variables."
-                }
-            
-            # Construct login URL
-            login_url = f"{self.config.base_url}/login"
-            
-            if self.agent:
-                # Use real agent for login
-                task = f"Navigate to {login_url} and login with username {username}"
-                result = await self.agent.run()
-                self.session_active = True
-                return {
-                    "success": True,
-                    "message": "Logged in to Jira",
-                    "session_active": True
-                }
-            else:
-                # Mock response for now
-                return {
-                    "success": True,
-                    "message": "Jira login simulated",
-                    "session_active": True
-                }
-                
-        except Exception as e:
-            return {
-                "success": False,
-                "error": f"Login failed: {str(e)}"
-            }
-    
-    async def export_tickets(self, project_key: str, start_date: str, end_date: str, 
-                           output_format: str = "csv") -> Dict[str, Any]:
-        """
-        Export Jira tickets for a project within date range
-        """
-        try:
-            if not self.session_active:
-                login_result = await self.login()
-                if not login_result["success"]:
-                    return login_result
-            
-            # Validate project key format
-            if not project_key.isupper() or len(project_key) < 2:
-                return {
-                    "success": False,
-                    "error": "Invalid project key format. Should be uppercase (e.g., 'ENG', 'PROJ')"
-                }
-            
-            # Construct export URL with filters
-            export_url = f"{self.config.base_url}/projects/{project_key}/issues"
-            filters = f"?from={start_date}&to={end_date}&format={output_format}"
-            full_url = export_url + filters
-            
-            if self.agent:
-                # Use real agent for export
-                task = f"Go to {full_url}, find export button, and download the {output_format} file"
-                result = await self.agent.run()
-                
-                return {
-                    "success": True,
-                    "project_key": project_key,
-                    "date_range": f"{start_date} to {end_date}",
-                    "format": output_format,
-                    "file_path": f"./exports/{project_key}_{start_date}_{end_date}.{output_format}",
-                    "message": "Export completed"
-                }
-            else:
-                # Mock response for now
-                return {
-                    "success": True,
-                    "project_key": project_key,
-                    "date_range": f"{start_date} to {end_date}",
-                    "format": output_format,
-                    "file_path": f"./exports/{project_key}_{start_date}_{end_date}.{output_format}",
-                    "message": "Jira export simulated"
-                }
-                
-        except Exception as e:
-            return {
-                "success": False,
-                "error": f"Export failed: {str(e)}"
-            }
-    
-    async def create_ticket(self, project_key: str, title: str, description: str, 
-                          ticket_type: str = "Task") -> Dict[str, Any]:
-        """
-        Create a new Jira ticket
-        """
-        try:
-            if not self.session_active:
-                login_result = await self.login()
-                if not login_result["success"]:
-                    return login_result
-            
-            # Sanitize inputs
-            if len(title) > 200:
-                title = title[:197] + "..."
-            
-            if self.agent:
-                task = f"Create a new {ticket_type} ticket in project {project_key} with title '{title}' and description '{description[:100]}...'"
-                result = await self.agent.run()
-                
-                return {
-                    "success": True,
-                    "project_key": project_key,
-                    "ticket_type": ticket_type,
-                    "title": title,
-                    "ticket_id": f"{project_key}-{123}",  # Would be real ID from result
-                    "message": "Ticket created successfully"
-                }
-            else:
-                # Mock response
-                return {
-                    "success": True,
-                    "project_key": project_key,
-                    "ticket_type": ticket_type,
-                    "title": title,
-                    "ticket_id": f"{project_key}-{123}",
-                    "message": "Jira ticket creation simulated"
-                }
-                
-        except Exception as e:
-            return {
-                "success": False,
-                "error": f"Ticket creation failed: {str(e)}"
-            }
-    
-    async def search_tickets(self, jql_query: str, max_results: int = 50) -> Dict[str, Any]:
-        """
-        Search Jira tickets using JQL
-        """
-        try:
-            if not self.session_active:
-                login_result = await self.login()
-                if not login_result["success"]:
-                    return login_result
-            
-            # Basic JQL validation
-            if "DELETE" in jql_query.upper() or "UPDATE" in jql_query.upper():
-                return {
-                    "success": False,
-                    "error": "Only SELECT queries are allowed"
-                }
-            
-            if self.agent:
-                task = f"Search Jira tickets using JQL: {jql_query} with max {max_results} results"
-                result = await self.agent.run()
-                
-                return {
-                    "success": True,
-                    "jql_query": jql_query,
-                    "max_results": max_results,
-                    "tickets": [],  # Would be populated from real search
-                    "message": "Search completed"
-                }
-            else:
-                # Mock response
-                return {
-                    "success": True,
-                    "jql_query": jql_query,
-                    "max_results": max_results,
-                    "tickets": [
-                        {
-                            "id": "ENG-123",
-                            "title": "Sample ticket",
-                            "status": "In Progress",
-                            "assignee": "john.doe"
-                        }
-                    ],
-                    "message": "Jira search simulated"
-                }
-                
-        except Exception as e:
-            return {
-                "success": False,
-                "error": f"Search failed: {str(e)}"
-            }
-    
-    def get_capabilities(self) -> Dict[str, Any]:
-        """
-        Get tool capabilities and constraints
-        """
-        return {
-            "name": "JiraTool",
-            "allowed_domains": self.allowed_domains,
-            "has_sensitive_data": self.has_sensitive_data,
-            "required_permissions": self.required_permissions,
-            "operations": [
-                "login",
-                "export_tickets", 
-                "create_ticket",
-                "search_tickets"
-            ],
-            "constraints": {
-                "max_export_days": 365,
-                "max_search_results": 1000,
-                "allowed_formats": ["csv", "json", "xlsx"]
-            }
-        }
-
-
-# Factory function for creating domain tools
-def create_jira_tool(base_url: str, agent: Optional[Agent] = None) -> JiraTool:
-    """
-    Factory function to create a configured Jira tool
-    """
-    config = JiraConfig(
-        base_url=base_url,
-        username=os.getenv("JIRA_USER"),
-        password=os.getenv("JIRA_PASS")
-    )
-    
-    return JiraTool(config, agent)
-
-
-# Example usage and test
-async def test_jira_tool():
-    """Test the Jira tool functionality"""
-    print("🧪 Testing Jira Tool...")
-    
-    tool = create_jira_tool("https://jira.company.com")
-    
-    # Test capabilities
-    capabilities = tool.get_capabilities()
-    print(f"📋 Capabilities: {capabilities}")
-    
-    # Test login
-    login_result = await tool.login()
-    print(f"🔐 Login result: {login_result}")
-    
-    # Test export
-    export_result = await tool.export_tickets("ENG", "2025-09-01", "2025-09-15")
-    print(f"📤 Export result: {export_result}")
-    
-    # Test search
-    search_result = await tool.search_tickets("project = ENG AND status = 'In Progress'")
-    print(f"🔍 Search result: {search_result}")
-    
-    print("✅ Jira tool tests completed")
-
-
-if __name__ == "__main__":
-    asyncio.run(test_jira_tool())
\ No newline at end of file